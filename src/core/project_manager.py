@@ -6,11 +6,12 @@
 """
 
 import os
+import re
 import json
 import time
 import shutil
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
 try:
@@ -19,12 +20,59 @@ except ImportError:
     import logging
     logger = logging.getLogger(__name__)
 
+# 项目名称中不能用作文件夹名称的字符
+INVALID_NAME_RE = re.compile(r'[<>:"/\\|?*]')
+
+# 可选：使用orjson加速项目配置解析
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def load_json_file(file_path: Path) -> Any:
+    """读取并解析JSON文件，安装了orjson时优先使用"""
+    if orjson is not None:
+        return orjson.loads(Path(file_path).read_bytes())
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+# 导出文件写入缓冲区大小，减少大项目导出时的写入系统调用
+_JSON_WRITE_BUFFER = 1 << 20
+
+def _dumps_json(data: Any) -> bytes:
+    """序列化为缩进2格的UTF-8 JSON字节串，安装了orjson时优先使用"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+def _iter_json_chunks(data: Any, depth: int, level: int = 0):
+    """逐块生成缩进2格的JSON字节串，前depth层字典按键拆分序列化，不在内存中拼出完整文件"""
+    if depth <= 0 or not isinstance(data, dict) or not data:
+        chunk = _dumps_json(data)
+        if level:
+            chunk = chunk.replace(b"\n", b"\n" + b"  " * level)
+        yield chunk
+        return
+    inner_indent = b"  " * (level + 1)
+    yield b"{"
+    for i, (key, value) in enumerate(data.items()):
+        yield (b",\n" if i else b"\n") + inner_indent + _dumps_json(str(key)) + b": "
+        yield from _iter_json_chunks(value, depth - 1, level + 1)
+    yield b"\n" + b"  " * level + b"}"
+
+def _dump_json_file(data: Any, file_path: Path, depth: int = 2):
+    """将数据流式写为缩进2格的UTF-8 JSON文件"""
+    with open(file_path, 'wb', buffering=_JSON_WRITE_BUFFER) as f:
+        f.writelines(_iter_json_chunks(data, depth))
+
 class ProjectManager:
     """项目管理器"""
     
     def __init__(self, base_output_dir: str = "output"):
         self.base_output_dir = Path(base_output_dir)
         self.current_project: Optional[Dict[str, Any]] = None
+        # 项目摘要缓存：项目目录 -> (project.json的mtime_ns, 摘要)
+        self._summary_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
         
         # 确保输出目录存在
         self.base_output_dir.mkdir(exist_ok=True)
@@ -210,6 +258,7 @@ class ProjectManager:
             project_file = os.path.join(project_dir, "project.json")
             with open(project_file, 'w', encoding='utf-8') as f:
                 json.dump(project_config, f, ensure_ascii=False, indent=2)
+            self._remember_summary(str(project_dir), project_file, project_config)
             
             # 设置当前项目
             self.current_project = project_config
@@ -224,10 +273,7 @@ class ProjectManager:
     def _clean_project_name(self, name: str) -> str:
         """清理项目名称，移除不合法的文件名字符"""
         # 移除/替换不合法字符
-        invalid_chars = '<>:"/\\|?*'
-        clean_name = name
-        for char in invalid_chars:
-            clean_name = clean_name.replace(char, '_')
+        clean_name = INVALID_NAME_RE.sub('_', name)
         
         # 移除前后空格并限制长度
         clean_name = clean_name.strip()[:50]
@@ -257,8 +303,14 @@ class ProjectManager:
         
         logger.info(f"项目目录结构创建完成: {project_dir}")
     
-    def load_project(self, project_path: str) -> Dict[str, Any]:
-        """加载现有项目"""
+    def load_project(self, project_path: str,
+                     prefetched: Optional[Tuple[int, Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """加载现有项目
+        
+        Args:
+            project_path: 项目目录或project.json路径
+            prefetched: 已预读的(mtime_ns, 项目配置)，文件未变化时直接使用，不再读盘
+        """
         try:
             project_file = Path(project_path)
             
@@ -269,8 +321,10 @@ class ProjectManager:
             if not project_file.exists():
                 raise FileNotFoundError(f"项目文件不存在: {project_file}")
             
-            with open(project_file, 'r', encoding='utf-8') as f:
-                project_config = json.load(f)
+            if prefetched is not None and prefetched[0] == project_file.stat().st_mtime_ns:
+                project_config = prefetched[1]
+            else:
+                project_config = load_json_file(project_file)
             # 兼容旧项目，补全created_time字段
             if "created_time" not in project_config:
                 if "created_at" in project_config:
@@ -306,6 +360,8 @@ class ProjectManager:
             with open(config_file, 'w', encoding='utf-8') as f:
                 json.dump(self.current_project, f, ensure_ascii=False, indent=2)
             
+            self._remember_summary(str(project_dir), config_file, self.current_project)
+            
             logger.info(f"项目保存成功: {self.current_project['project_name']}")
             return True
             
@@ -343,27 +399,52 @@ class ProjectManager:
         else:
             return subdir
     
-    def save_text_content(self, content: str, text_type: str) -> str:
-        """保存文本内容"""
-        try:
-            if text_type == "original_text":
-                filename = "original_text.txt"
-            elif text_type == "rewritten_text":
-                filename = "rewritten_text.txt"
-            else:
-                raise ValueError(f"不支持的文本类型: {text_type}")
-            
-            file_path = self.get_project_file_path(text_type, filename)
+    def get_text_file_path(self, text_type: str) -> str:
+        """获取文本类型对应的文件路径"""
+        if text_type == "original_text":
+            filename = "original_text.txt"
+        elif text_type == "rewritten_text":
+            filename = "rewritten_text.txt"
+        else:
+            raise ValueError(f"不支持的文本类型: {text_type}")
+        
+        return str(self.get_project_file_path(text_type, filename))
+    
+    @staticmethod
+    def write_text_files(files: Dict[str, Tuple[str, str]]) -> Dict[str, str]:
+        """只写入文本文件，不读取也不修改项目配置，可在工作线程中调用
+        
+        Args:
+            files: 文本类型 -> (文件路径, 文本内容)
             
+        Returns:
+            文本类型 -> 已写入的文件路径
+        """
+        saved = {}
+        for text_type, (file_path, content) in files.items():
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(content)
+            saved[text_type] = file_path
+        return saved
+    
+    def record_text_files(self, saved: Dict[str, str]) -> bool:
+        """记录已写入的文本文件路径并保存一次项目配置"""
+        if not saved:
+            return True
+        self.current_project["files"].update(saved)
+        return self.save_project()
+    
+    def save_text_content(self, content: str, text_type: str) -> str:
+        """保存文本内容"""
+        try:
+            file_path = self.get_text_file_path(text_type)
+            self.write_text_files({text_type: (file_path, content)})
             
             # 更新项目配置
-            self.current_project["files"][text_type] = str(file_path)
-            self.save_project()
+            self.record_text_files({text_type: file_path})
             
             logger.info(f"文本内容已保存: {file_path}")
-            return str(file_path)
+            return file_path
             
         except Exception as e:
             logger.error(f"保存文本内容失败: {e}")
@@ -465,8 +546,7 @@ class ProjectManager:
                 "exported_by": "AI Video Generator"
             }
             
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, ensure_ascii=False, indent=2)
+            _dump_json_file(export_data, export_path)
             
             logger.info(f"项目导出成功: {export_path}")
             return str(export_path)
@@ -613,39 +693,37 @@ class ProjectManager:
         }
     
     def list_projects(self) -> List[Dict[str, Any]]:
-        """列出所有项目"""
+        """列出所有项目（一次目录扫描，project.json未变化的项目直接使用缓存的摘要）"""
         try:
             projects = []
-            
-            for item in self.base_output_dir.iterdir():
-                if item.is_dir():
-                    project_file = item / "project.json"
-                    if project_file.exists():
+            summary_cache = {}
+            
+            with os.scandir(self.base_output_dir) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    project_file = os.path.join(entry.path, "project.json")
+                    try:
+                        mtime_ns = os.stat(project_file).st_mtime_ns
+                    except OSError:
+                        continue
+                    
+                    cached = self._summary_cache.get(entry.path)
+                    if cached is not None and cached[0] == mtime_ns:
+                        summary = cached[1]
+                    else:
                         try:
-                            with open(project_file, 'r', encoding='utf-8') as f:
-                                project_config = json.load(f)
-                            
-                            # 兼容新旧版本的项目配置格式
-                            project_name = project_config.get("project_name") or project_config.get("name")
-                            clean_name = project_config.get("clean_name", project_name)
-                            
-                            # 确保created_time字段存在
-                            if "created_time" not in project_config:
-                                created_time = project_config.get("created_at", datetime.now().isoformat())
-                                project_config["created_time"] = created_time
-                                # 保存更新后的配置
-                                with open(project_file, 'w', encoding='utf-8') as f:
-                                    json.dump(project_config, f, ensure_ascii=False, indent=2)
-                            
-                            projects.append({
-                                "name": project_name,
-                                "clean_name": clean_name,
-                                "path": str(item),
-                                "created_time": project_config["created_time"],
-                                "last_modified": project_config["last_modified"]
-                            })
+                            summary, mtime_ns = self._read_project_summary(entry.path, project_file, mtime_ns)
                         except Exception as e:
                             logger.warning(f"读取项目配置失败: {project_file}, {e}")
+                            continue
+                    
+                    summary_cache[entry.path] = (mtime_ns, summary)
+                    # 返回副本，调用方修改摘要不会影响缓存
+                    projects.append(dict(summary))
+            
+            # 只保留仍然存在的项目
+            self._summary_cache = summary_cache
             
             # 按最后修改时间排序
             projects.sort(key=lambda x: x["last_modified"], reverse=True)
@@ -656,6 +734,42 @@ class ProjectManager:
             logger.error(f"列出项目失败: {e}")
             return []
     
+    def _read_project_summary(self, project_dir: str, project_file: str, mtime_ns: int) -> Tuple[Dict[str, Any], int]:
+        """读取project.json并生成项目摘要，返回(摘要, 文件当前的mtime_ns)"""
+        project_config = load_json_file(project_file)
+        
+        # 确保created_time字段存在
+        if "created_time" not in project_config:
+            created_time = project_config.get("created_at", datetime.now().isoformat())
+            project_config["created_time"] = created_time
+            # 保存更新后的配置
+            with open(project_file, 'w', encoding='utf-8') as f:
+                json.dump(project_config, f, ensure_ascii=False, indent=2)
+            mtime_ns = os.stat(project_file).st_mtime_ns
+        
+        return self._build_project_summary(project_dir, project_config), mtime_ns
+    
+    def _remember_summary(self, project_dir: str, project_file, project_config: Dict[str, Any]):
+        """写入project.json后同步更新项目列表缓存，之后列出项目时无需重新读取该项目"""
+        if "created_time" in project_config:
+            self._summary_cache[project_dir] = (
+                os.stat(project_file).st_mtime_ns,
+                self._build_project_summary(project_dir, project_config)
+            )
+    
+    def _build_project_summary(self, project_dir: str, project_config: Dict[str, Any]) -> Dict[str, Any]:
+        """由项目配置生成项目列表使用的摘要"""
+        # 兼容新旧版本的项目配置格式
+        project_name = project_config.get("project_name") or project_config.get("name")
+        clean_name = project_config.get("clean_name", project_name)
+        return {
+            "name": project_name,
+            "clean_name": clean_name,
+            "path": project_dir,
+            "created_time": project_config["created_time"],
+            "last_modified": project_config["last_modified"]
+        }
+    
     def delete_project(self, project_path: str) -> bool:
         """删除项目"""
         try:
@@ -663,6 +777,7 @@ class ProjectManager:
             
             if project_dir.exists() and project_dir.is_dir():
                 shutil.rmtree(project_dir)
+                self._summary_cache.pop(str(project_dir), None)
                 logger.info(f"项目已删除: {project_dir}")
                 
                 # 如果删除的是当前项目，清空当前项目
@@ -700,8 +815,7 @@ class ProjectManager:
                 return False
             
             # 读取导入的项目数据
-            with open(import_path, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
+            import_data = load_json_file(import_path)
             
             # 提取项目信息
             if "project_info" in import_data:
@@ -717,7 +831,6 @@ class ProjectManager:
                     # 移除导出文件的后缀
                     project_name = project_name.replace("_export", "")
                     # 移除时间戳
-                    import re
                     project_name = re.sub(r'_\d{8}_\d{6}$', '', project_name)
             
             # 清理项目名称
@@ -13,6 +13,10 @@ from PyQt5.QtGui import QFont, QIcon
 from utils.logger import logger
 from utils.color_optimizer import ColorOptimizer
 
+def _preview(text: str, limit: int) -> str:
+    """表格中显示的文本预览，超过limit个字符时截断并加省略号"""
+    return text[:limit] + '...' if text[limit:limit + 1] else text
+
 class CharacterSceneDialog(QDialog):
     """角色场景设置对话框"""
     
@@ -501,7 +505,7 @@ class CharacterSceneDialog(QDialog):
             self.character_table.setItem(row, 0, name_item)
             
             # 描述
-            desc_item = QTableWidgetItem(char_data.get('description', '')[:50] + '...' if len(char_data.get('description', '')) > 50 else char_data.get('description', ''))
+            desc_item = QTableWidgetItem(_preview(char_data.get('description') or '', 50))
             self.character_table.setItem(row, 1, desc_item)
             
             # 来源
@@ -565,7 +569,7 @@ class CharacterSceneDialog(QDialog):
             self.char_selection_table.setItem(row, 1, name_item)
             
             # 描述
-            desc_item = QTableWidgetItem(char_data.get('description', '')[:30] + '...' if len(char_data.get('description', '')) > 30 else char_data.get('description', ''))
+            desc_item = QTableWidgetItem(_preview(char_data.get('description') or '', 30))
             self.char_selection_table.setItem(row, 2, desc_item)
         
         # 加载场景选择表格
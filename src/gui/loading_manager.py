@@ -55,6 +55,10 @@ class LoadingWidget(QWidget):
     # 取消信号
     cancelRequested = pyqtSignal(str)  # task_id
     
+    # 旋转图标的颜色，每帧重绘时复用
+    _TRACK_COLOR = QColor(100, 100, 100, 80)
+    _ARC_COLOR = QColor(33, 150, 243, 255)
+    
     def __init__(self, loading_type: LoadingType, parent=None):
         super().__init__(parent)
         self.loading_type = loading_type
@@ -148,10 +152,10 @@ class LoadingWidget(QWidget):
         painter.setRenderHint(QPainter.Antialiasing)
         
         # 绘制旋转圆环
-        painter.setPen(QColor(100, 100, 100, 80))
+        painter.setPen(self._TRACK_COLOR)
         painter.drawEllipse(2, 2, 28, 28)
         
-        painter.setPen(QColor(33, 150, 243, 255))
+        painter.setPen(self._ARC_COLOR)
         painter.drawArc(2, 2, 28, 28, 0, 90 * 16)  # 90度弧线
         
         painter.end()
@@ -314,10 +318,10 @@ class LoadingWidget(QWidget):
         painter.translate(-16, -16)  # 移回原位
         
         # 绘制旋转圆环
-        painter.setPen(QColor(100, 100, 100, 80))
+        painter.setPen(self._TRACK_COLOR)
         painter.drawEllipse(2, 2, 28, 28)
         
-        painter.setPen(QColor(33, 150, 243, 255))
+        painter.setPen(self._ARC_COLOR)
         painter.drawArc(2, 2, 28, 28, 0, 90 * 16)
         
         painter.end()
@@ -400,10 +404,17 @@ class LoadingWidget(QWidget):
 class CircularProgress(QWidget):
     """圆形进度组件"""
     
+    # 绘制用颜色，所有实例共用，不在每次重绘时创建
+    _RING_COLOR = QColor(230, 230, 230)
+    _ARC_COLOR = QColor(33, 150, 243)
+    _TEXT_COLOR = QColor(33, 33, 33)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedSize(40, 40)
         self.value = 0
+        self._text_font = QFont()
+        self._text_font.setPointSize(8)
     
     def setValue(self, value):
         """设置进度值"""
@@ -416,20 +427,18 @@ class CircularProgress(QWidget):
         painter.setRenderHint(QPainter.Antialiasing)
         
         # 背景圆环
-        painter.setPen(QColor(230, 230, 230))
+        painter.setPen(self._RING_COLOR)
         painter.drawEllipse(2, 2, 36, 36)
         
         # 进度圆弧
-        painter.setPen(QColor(33, 150, 243))
+        painter.setPen(self._ARC_COLOR)
         start_angle = 90 * 16  # 从顶部开始
         span_angle = -int(self.value * 360 / 100 * 16)  # 顺时针
         painter.drawArc(2, 2, 36, 36, start_angle, span_angle)
         
         # 中心文本
-        painter.setPen(QColor(33, 33, 33))
-        font = QFont()
-        font.setPointSize(8)
-        painter.setFont(font)
+        painter.setPen(self._TEXT_COLOR)
+        painter.setFont(self._text_font)
         painter.drawText(self.rect(), Qt.AlignCenter, f"{int(self.value)}%")
 
 class LoadingManager(QObject):
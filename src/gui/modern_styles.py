@@ -6,13 +6,15 @@
 """
 
 import os
+import sys
 import json
-from typing import Dict, Any, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple, Callable
 from enum import Enum
 from pathlib import Path
 
 from PyQt5.QtWidgets import QApplication, QWidget, QPushButton, QLabel
-from PyQt5.QtCore import QObject, pyqtSignal, QSettings
+from PyQt5.QtCore import QObject, pyqtSignal, QSettings, QFile, QIODevice, QTextStream
 from PyQt5.QtGui import QPalette, QColor, QFont
 
 try:
@@ -27,12 +29,18 @@ class ThemeType(Enum):
     DARK = "dark"
     AUTO = "auto"  # 根据系统设置自动切换
 
+# 主题值到枚举的映射，加载设置时直接查表
+_THEME_TYPE_BY_VALUE: Dict[str, ThemeType] = {t.value: t for t in ThemeType}
+
 class ColorScheme:
     """颜色方案"""
     
+    __slots__ = ('name', 'colors')
+    
     def __init__(self, name: str, colors: Dict[str, str]):
         self.name = name
-        self.colors = colors
+        # 驻留颜色键，动态拼接的键查找时也能走指针比较的快速路径
+        self.colors = {sys.intern(k): v for k, v in colors.items()}
     
     def get_color(self, key: str, fallback: str = "#000000") -> str:
         """获取颜色值"""
@@ -187,33 +195,33 @@ class StyleTemplates:
             }}
             
             /* 扁平按钮 */
-            QPushButton[flat="true"] {{
+            QPushButton[buttonType="flat"] {{
                 background-color: transparent;
                 color: {theme.get_color('primary')};
                 border: 1px solid {theme.get_color('border')};
             }}
             
-            QPushButton[flat="true"]:hover {{
+            QPushButton[buttonType="flat"]:hover {{
                 background-color: {theme.get_color('hover')};
             }}
             
             /* 危险按钮 */
-            QPushButton[danger="true"] {{
+            QPushButton[buttonType="danger"] {{
                 background-color: {theme.get_color('error')};
                 color: {theme.get_color('text_on_primary')};
             }}
             
-            QPushButton[danger="true"]:hover {{
+            QPushButton[buttonType="danger"]:hover {{
                 background-color: #D32F2F;
             }}
             
             /* 成功按钮 */
-            QPushButton[success="true"] {{
+            QPushButton[buttonType="success"] {{
                 background-color: {theme.get_color('success')};
                 color: {theme.get_color('text_on_primary')};
             }}
             
-            QPushButton[success="true"]:hover {{
+            QPushButton[buttonType="success"]:hover {{
                 background-color: #388E3C;
             }}
         """
@@ -445,6 +453,39 @@ class StyleTemplates:
             }}
         """
 
+# 按主题名缓存的完整样式表，切换主题时复用，不再重复拼接
+# 注意：修改主题颜色或样式模板后需调用 _STYLESHEET_CACHE.clear()
+_STYLESHEET_CACHE: Dict[str, str] = {}
+
+# 样式文件目录（项目根目录下的assets）
+_ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
+
+# 各组件注册的附加应用级样式，应用主题时拼接在主题样式表之后
+_EXTRA_STYLESHEETS: List[str] = []
+
+@lru_cache(maxsize=None)
+def load_qss_file(name: str) -> str:
+    """读取assets目录下的QSS文件（每个文件只读取一次）"""
+    qfile = QFile(str(_ASSETS_DIR / name))
+    if not qfile.open(QIODevice.ReadOnly | QIODevice.Text):
+        logger.warning(f"无法读取样式文件 {name}: {qfile.errorString()}")
+        return ""
+    try:
+        stream = QTextStream(qfile)
+        stream.setCodec("UTF-8")
+        return stream.readAll()
+    finally:
+        qfile.close()
+
+def register_app_stylesheet(qss: str):
+    """注册附加的应用级样式（重复注册同一样式无效），切换主题后仍然保留"""
+    if not qss or qss in _EXTRA_STYLESHEETS:
+        return
+    _EXTRA_STYLESHEETS.append(qss)
+    app = QApplication.instance()
+    if app and qss not in app.styleSheet():
+        app.setStyleSheet(app.styleSheet() + qss)
+
 class StyleManager(QObject):
     """样式管理器"""
     
@@ -454,13 +495,29 @@ class StyleManager(QObject):
     def __init__(self):
         super().__init__()
         
-        # 缓存样式表 - 必须在其他初始化之前
-        self._style_cache: Dict[str, str] = {}
+        # 缓存样式表 - 必须在其他初始化之前（模块级共享，键包含主题名）
+        self._style_cache: Dict[str, str] = _STYLESHEET_CACHE
+        
+        # 已应用到QApplication的主题名，避免重复解析同一份QSS
+        self._applied_theme: Optional[str] = None
         
         # 当前主题
         self.current_theme_type = ThemeType.LIGHT
         self.current_theme = ModernThemes.get_light_theme()
         
+        # 系统主题检测结果缓存，系统调色板变化时失效
+        self._system_theme_cache: Optional[ColorScheme] = None
+        app = QApplication.instance()
+        if app is not None:
+            app.paletteChanged.connect(self._invalidate_system_theme)
+        
+        # 主题类型到构建函数的分发表
+        self._theme_builders: Dict[ThemeType, Callable[[], ColorScheme]] = {
+            ThemeType.LIGHT: ModernThemes.get_light_theme,
+            ThemeType.DARK: ModernThemes.get_dark_theme,
+            ThemeType.AUTO: self._get_system_theme,  # 根据系统设置决定
+        }
+        
         # 设置管理
         self.settings = QSettings("AIVideoGenerator", "StyleManager")
         
@@ -471,46 +528,50 @@ class StyleManager(QObject):
         """加载主题设置"""
         try:
             theme_name = self.settings.value("theme", ThemeType.LIGHT.value)
-            self.set_theme(ThemeType(theme_name))
+            theme_type = _THEME_TYPE_BY_VALUE.get(theme_name, ThemeType.LIGHT)
+            self.set_theme(theme_type, persist=False)
         except Exception as e:
             logger.warning(f"加载主题设置失败: {e}")
-            self.set_theme(ThemeType.LIGHT)
+            self.set_theme(ThemeType.LIGHT, persist=False)
     
     def save_theme_settings(self):
         """保存主题设置"""
-        try:
-            self.settings.setValue("theme", self.current_theme_type.value)
-        except Exception as e:
-            logger.error(f"保存主题设置失败: {e}")
+        self.settings.setValue("theme", self.current_theme_type.value)
     
-    def set_theme(self, theme_type: ThemeType):
-        """设置主题"""
+    def set_theme(self, theme_type: ThemeType, persist: bool = True):
+        """设置主题
+
+        Args:
+            theme_type: 目标主题类型
+            persist: 是否写入QSettings；启动加载或系统主题自动检测时传False，避免重复写盘
+        """
         if theme_type == self.current_theme_type:
             return
         
         self.current_theme_type = theme_type
+        self.current_theme = self._theme_builders[theme_type]()
         
-        if theme_type == ThemeType.LIGHT:
-            self.current_theme = ModernThemes.get_light_theme()
-        elif theme_type == ThemeType.DARK:
-            self.current_theme = ModernThemes.get_dark_theme()
-        elif theme_type == ThemeType.AUTO:
-            # 根据系统设置决定
-            self.current_theme = self._get_system_theme()
+        # 样式表缓存按主题名区分，切换时保留；颜色查找缓存需清空
+        _lookup_color.cache_clear()
         
-        # 清空样式缓存
-        self._style_cache.clear()
-        
-        # 保存设置
-        self.save_theme_settings()
+        # 仅在显式切换时保存设置
+        if persist:
+            self.save_theme_settings()
         
         # 发送信号
         self.theme_changed.emit(self.current_theme.name)
         
         logger.info(f"切换到主题: {self.current_theme.name}")
     
+    def _invalidate_system_theme(self, *_):
+        """系统调色板变化时清除系统主题缓存"""
+        self._system_theme_cache = None
+    
     def _get_system_theme(self) -> ColorScheme:
         """获取系统主题"""
+        if self._system_theme_cache is not None:
+            return self._system_theme_cache
+        
         try:
             # 检查系统是否使用深色模式
             app = QApplication.instance()
@@ -519,9 +580,11 @@ class StyleManager(QObject):
                 window_color = palette.color(QPalette.Window)
                 # 如果窗口背景较暗，使用深色主题
                 if window_color.lightness() < 128:
-                    return ModernThemes.get_dark_theme()
+                    self._system_theme_cache = ModernThemes.get_dark_theme()
+                    return self._system_theme_cache
             
-            return ModernThemes.get_light_theme()
+            self._system_theme_cache = ModernThemes.get_light_theme()
+            return self._system_theme_cache
         except Exception as e:
             logger.warning(f"检测系统主题失败: {e}")
             return ModernThemes.get_light_theme()
@@ -543,6 +606,9 @@ class StyleManager(QObject):
             StyleTemplates.get_progress_style(self.current_theme),
             StyleTemplates.get_combobox_style(self.current_theme),
             StyleTemplates.get_scrollbar_style(self.current_theme),
+            # 组件样式（主按钮、通知等）：主窗口的样式表会覆盖应用级样式表，
+            # 因此必须包含在设置到主窗口的完整样式表中
+            load_qss_file("components.qss"),
         ]
         
         complete_style = "\n".join(styles)
@@ -647,21 +713,25 @@ class StyleManager(QObject):
         """
     
     def apply_to_widget(self, widget: QWidget):
-        """应用样式到指定组件"""
-        try:
-            widget.setStyleSheet(self.get_complete_stylesheet())
-        except Exception as e:
-            logger.error(f"应用样式失败: {e}")
+        """应用样式到指定组件（优先使用应用级样式）"""
+        if self._applied_theme == self.current_theme.name:
+            # 应用级样式已生效，组件通过继承获得样式，无需再次解析
+            logger.debug("应用级样式已生效，跳过组件级样式设置")
+            return
+        widget.setStyleSheet(self.get_complete_stylesheet())
     
     def apply_to_application(self):
         """应用样式到整个应用"""
-        try:
-            app = QApplication.instance()
-            if app:
-                app.setStyleSheet(self.get_complete_stylesheet())
-                logger.info("已应用样式到整个应用")
-        except Exception as e:
-            logger.error(f"应用应用样式失败: {e}")
+        if self._applied_theme == self.current_theme.name:
+            return
+        app = QApplication.instance()
+        if app:
+            stylesheet = self.get_complete_stylesheet()
+            # 已包含在完整样式表中的附加样式不再重复追加
+            stylesheet += "".join(qss for qss in _EXTRA_STYLESHEETS if qss not in stylesheet)
+            app.setStyleSheet(stylesheet)
+            self._applied_theme = self.current_theme.name
+            logger.info("已应用样式到整个应用")
     
     def get_color(self, key: str, fallback: str = "#000000") -> str:
         """获取当前主题的颜色"""
@@ -692,6 +762,8 @@ def get_style_manager():
                 print("警告：没有QApplication实例，样式系统将不可用")
                 return None
             _style_manager = StyleManager()
+            # 直接设置模块属性，后续访问style_manager不再经过__getattr__
+            globals()['style_manager'] = _style_manager
         except Exception as e:
             print(f"创建样式管理器失败: {e}")
             return None
@@ -702,10 +774,13 @@ def apply_modern_style(widget: QWidget = None):
     """应用现代化样式"""
     manager = get_style_manager()
     if manager:
-        if widget:
-            manager.apply_to_widget(widget)
-        else:
-            manager.apply_to_application()
+        try:
+            if widget:
+                manager.apply_to_widget(widget)
+            else:
+                manager.apply_to_application()
+        except Exception as e:
+            logger.error(f"应用样式失败: {e}")
     else:
         print("样式系统不可用")
 
@@ -725,11 +800,16 @@ def toggle_theme():
     else:
         print("无法切换主题")
 
+@lru_cache(maxsize=128)
+def _lookup_color(theme_name: str, key: str, fallback: str) -> str:
+    """按主题名缓存的颜色查找，主题切换时由StyleManager清空"""
+    return _style_manager.current_theme.colors.get(key, fallback)
+
 def get_current_color(key: str, fallback: str = "#000000") -> str:
     """获取当前主题颜色"""
     manager = get_style_manager()
     if manager:
-        return manager.get_color(key, fallback)
+        return _lookup_color(manager.current_theme.name, key, fallback)
     else:
         return fallback
 
@@ -741,7 +821,7 @@ def get_current_qcolor(key: str, fallback: str = "#000000") -> QColor:
     else:
         return QColor(fallback)
 
-# 为了向后兼容，提供style_manager属性
+# 为了向后兼容，提供style_manager属性（仅在首次初始化前生效）
 def __getattr__(name):
     """模块级别的属性访问"""
     if name == 'style_manager':
@@ -751,23 +831,13 @@ def __getattr__(name):
 # 动态样式应用函数
 def apply_button_style(button: QPushButton, button_type: str = "primary"):
     """应用按钮样式"""
-    if button_type == "primary":
-        button.setProperty("flat", False)
-        button.setProperty("danger", False)
-        button.setProperty("success", False)
-    elif button_type == "flat":
-        button.setProperty("flat", True)
-        button.setProperty("danger", False)
-        button.setProperty("success", False)
-    elif button_type == "danger":
-        button.setProperty("flat", False)
-        button.setProperty("danger", True)
-        button.setProperty("success", False)
-    elif button_type == "success":
-        button.setProperty("flat", False)
-        button.setProperty("danger", False)
-        button.setProperty("success", True)
+    # 类型未变化时跳过，避免重复的unpolish/polish
+    if button.property("buttonType") == button_type:
+        return
+    
+    # 单一属性驱动QSS选择器，仅需一次属性写入和一次样式刷新
+    button.setProperty("buttonType", button_type)
     
     # 刷新样式
     button.style().unpolish(button)
-    button.style().polish(button)
\ No newline at end of file
+    button.style().polish(button)
@@ -9,7 +9,11 @@ import sys
 import os
 import asyncio
 import json
-from typing import Dict, List, Optional, Any, Callable
+import threading
+import concurrent.futures
+from collections import deque
+from functools import lru_cache, partial
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from pathlib import Path
 
 from PyQt5.QtWidgets import (
@@ -21,8 +25,13 @@ from PyQt5.QtWidgets import (
     QFrame, QListWidget, QListWidgetItem, QTableWidget, QTableWidgetItem,
     QDialog, QDesktopWidget, QMenuBar, QMenu, QAction
 )
-from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal, QObject, QSize, QDateTime
-from PyQt5.QtGui import QIcon, QPixmap, QFont, QPalette, QColor
+from PyQt5.QtCore import (
+    Qt, QTimer, pyqtSignal, QObject, QSize, QDateTime, QRunnable, QThreadPool,
+    QFile, QIODevice, QTextStream, QSignalBlocker, QUrl, QDir
+)
+from PyQt5.QtGui import (
+    QIcon, QPixmap, QFont, QPalette, QColor, QImage, QImageReader, QDesktopServices
+)
 
 # 导入重构后的核心组件
 from core.app_controller import AppController
@@ -54,17 +63,177 @@ except ImportError:
     )
     from notification_system import show_success, show_info
 
+def _read_text_file(path_str: str) -> str:
+    """读取UTF-8文本文件"""
+    # 由QFile/QTextStream在Qt侧完成读取和UTF-8解码，不经过Python的逐块文本IO
+    qfile = QFile(path_str)
+    if not qfile.open(QIODevice.ReadOnly | QIODevice.Text):
+        raise IOError(f"无法打开文件: {path_str} ({qfile.errorString()})")
+    try:
+        stream = QTextStream(qfile)
+        stream.setCodec("UTF-8")
+        return stream.readAll()
+    finally:
+        qfile.close()
+
+@lru_cache(maxsize=64)
+def _read_text(path_str: str, mtime_ns: int, size: int) -> str:
+    """读取文本文件内容（按修改时间和大小缓存，文件变化后自动失效）"""
+    return _read_text_file(path_str)
+
+def _read_text_cached(path: Path) -> str:
+    """读取文本文件，重复打开同一项目时直接命中缓存"""
+    stat = path.stat()
+    return _read_text(str(path), stat.st_mtime_ns, stat.st_size)
+
+# 界面文本常量
+WINDOW_TITLE_FMT = "AI 视频生成系统 - {}"
+TEXT_PLACEHOLDER_EMPTY = "请先创建项目，然后输入要转换为视频的文本内容..."
+TEXT_PLACEHOLDER_PROJECT_FMT = "项目：{}\n请输入要转换为视频的文本内容..."
+
+# 停止输入多久后自动保存（毫秒）
+_AUTOSAVE_DELAY_MS = 400
+
+# 退出时等待应用控制器关闭的最长时间（秒）
+_SHUTDOWN_TIMEOUT_S = 5
+
+# 导出文件的写缓冲区大小
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+# 项目图像列表每次事件循环添加的数量
+_IMAGE_BATCH_SIZE = 10
+
+# 数值输入框参数表：(属性名, 控件类型, 最小值, 最大值, 默认值, 步长)
+_IMAGE_SPIN_SPECS = (
+    ("width_spin", QSpinBox, 256, 2048, 1024, 64),
+    ("height_spin", QSpinBox, 256, 2048, 576, 64),
+    ("steps_spin", QSpinBox, 10, 100, 20, 1),
+    ("cfg_scale_spin", QDoubleSpinBox, 1.0, 20.0, 7.0, 0.5),
+)
+
+_VIDEO_SPIN_SPECS = (
+    ("fps_spin", QSpinBox, 15, 60, 24, 1),
+    ("duration_spin", QDoubleSpinBox, 1.0, 10.0, 3.0, 0.5),
+)
+
+# 项目状态面板中的文件类型名称
+_FILE_STATUS_NAMES = {
+    "original_text": "原始文本",
+    "rewritten_text": "改写文本",
+    "storyboard": "分镜脚本",
+    "images": "生成图片",
+    "audio": "音频文件",
+    "video": "视频文件",
+    "final_video": "最终视频",
+    "subtitles": "字幕文件"
+}
+
+# 异步任务失败时的提示：任务类型 -> (对话框标题, 错误说明)
+_WORKER_ERROR_MESSAGES = {
+    "generate": ("生成失败", "视频生成失败"),
+    "storyboard": ("生成失败", "分镜生成失败"),
+    "images": ("生成失败", "图像生成失败"),
+    "video": ("创建失败", "视频创建失败"),
+    "animated": ("创建失败", "动画视频创建失败"),
+    "subtitles": ("添加失败", "字幕添加失败"),
+}
+
+# 状态图标，按bool索引：_STATUS_ICONS[exists]
+_STATUS_ICONS = ("❌", "✅")
+
+# 五阶段分镜各阶段的显示名称
+_STORYBOARD_STAGE_NAMES = (
+    ("stage_1", "  └ 世界观圣经"),
+    ("stage_2", "  └ 角色管理"),
+    ("stage_3", "  └ 场景分割"),
+    ("stage_4", "  └ 分镜脚本"),  # 第4阶段：分镜脚本生成
+    ("stage_5", "  └ 优化预览"),
+)
+
+# 预先拼好的状态行，按bool索引：未完成/已完成
+_FILE_STATUS_LINES = {
+    file_type: tuple(f"{icon} {name}\n" for icon in _STATUS_ICONS)
+    for file_type, name in _FILE_STATUS_NAMES.items()
+}
+_STORYBOARD_STAGE_LINES = tuple(
+    (stage_key, tuple(f"{icon} {stage_name}\n" for icon in _STATUS_ICONS))
+    for stage_key, stage_name in _STORYBOARD_STAGE_NAMES
+)
+
+def _existing_paths(paths) -> set:
+    """批量检查文件是否存在：每个目录只扫描一次，代替逐个stat"""
+    by_dir: Dict[str, list] = {}
+    for path in paths:
+        path = str(path)
+        by_dir.setdefault(os.path.dirname(os.path.abspath(path)), []).append(path)
+    
+    existing = set()
+    for dir_path, group in by_dir.items():
+        try:
+            with os.scandir(dir_path) as entries:
+                names = {os.path.normcase(entry.name) for entry in entries}
+        except OSError:
+            continue
+        existing.update(p for p in group if os.path.normcase(os.path.basename(p)) in names)
+    return existing
+
 class WorkerSignals(QObject):
     """工作线程信号"""
     progress = pyqtSignal(float, str)  # 进度, 消息
     finished = pyqtSignal(object)  # 结果
     error = pyqtSignal(str)  # 错误信息
 
-class AsyncWorker(QThread):
-    """异步工作线程"""
+class AsyncRunner:
+    """共享异步执行器：单个常驻后台线程持有一个asyncio事件循环，所有协程任务复用"""
+    
+    _instance = None
+    _instance_lock = threading.Lock()
+    
+    def __init__(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="AsyncRunner", daemon=True)
+        self._thread.start()
+    
+    @classmethod
+    def instance(cls) -> "AsyncRunner":
+        """获取全局共享实例"""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+    
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+    
+    def submit(self, coro) -> concurrent.futures.Future:
+        """提交协程到共享事件循环"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+    
+    def shutdown(self, timeout: float = 5.0):
+        """停止共享事件循环：清理异步生成器后关闭循环"""
+        with AsyncRunner._instance_lock:
+            if AsyncRunner._instance is self:
+                AsyncRunner._instance = None
+        
+        if not self._thread.is_alive():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(
+                self._loop.shutdown_asyncgens(), self._loop
+            ).result(timeout)
+        except Exception as e:
+            logger.warning(f"清理事件循环时出错: {e}")
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout)
+            if not self._loop.is_running():
+                self._loop.close()
+
+class AsyncWorker:
+    """异步任务句柄，协程提交到共享的AsyncRunner执行，通过signals回传结果"""
     
     def __init__(self, coro, *args, **kwargs):
-        super().__init__()
         self.coro = coro
         self.args = args
         self.kwargs = kwargs
@@ -73,48 +242,121 @@ class AsyncWorker(QThread):
         # 将signals移动到主线程，避免跨线程问题
         self.signals.moveToThread(QApplication.instance().thread())
         self.result = None
-        
-    def run(self):
+        self._future: Optional[concurrent.futures.Future] = None
+    
+    def start(self):
+        """提交任务"""
         try:
-            # 创建新的事件循环
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            try:
-                # 运行协程
-                self.result = loop.run_until_complete(
-                    self.coro(*self.args, **self.kwargs)
-                )
-                
-                self.signals.finished.emit(self.result)
-                
-            except Exception as e:
-                logger.error(f"异步任务执行失败: {e}")
-                self.signals.error.emit(str(e))
-            finally:
-                # 确保事件循环正确关闭
-                try:
-                    # 取消所有未完成的任务
-                    pending = asyncio.all_tasks(loop)
-                    for task in pending:
-                        task.cancel()
-                    
-                    # 等待所有任务完成或取消
-                    if pending:
-                        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
-                        
-                except Exception as cleanup_error:
-                    logger.warning(f"清理事件循环时出错: {cleanup_error}")
-                finally:
-                    loop.close()
-                    
+            self._future = AsyncRunner.instance().submit(
+                self.coro(*self.args, **self.kwargs)
+            )
+            self._future.add_done_callback(self._on_done)
         except Exception as e:
-            logger.error(f"线程执行失败: {e}")
+            logger.error(f"提交异步任务失败: {e}")
             self.signals.error.emit(str(e))
+    
+    def isRunning(self) -> bool:
+        """任务是否仍在执行"""
+        return self._future is not None and not self._future.done()
+    
+    def _on_done(self, future: concurrent.futures.Future):
+        # 在事件循环线程中回调，信号会排队投递到主线程
+        if future.cancelled():
+            return
+        try:
+            self.result = future.result()
+        except Exception as e:
+            logger.error(f"异步任务执行失败: {e}")
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(self.result)
+
+@lru_cache(maxsize=256)
+def _load_thumbnail(image_path: str, mtime_ns: int, size: int, width: int, height: int) -> QImage:
+    """解码并缩放图像（按修改时间和大小缓存，重复显示同一图像时不再解码）"""
+    reader = QImageReader(image_path)
+    if not reader.canRead():
+        # 只解析文件头即可判断，无法读取时不再尝试完整解码
+        return QImage()
+    reader.setAutoTransform(True)
+    original_size = reader.size()
+    if original_size.isValid():
+        # 解码时直接缩放，不必先解码整幅原图
+        reader.setScaledSize(original_size.scaled(QSize(width, height), Qt.KeepAspectRatio))
+    return reader.read()
+
+class ThumbnailSignals(QObject):
+    """缩略图加载信号"""
+    loaded = pyqtSignal(str, QImage)  # 图像路径, 缩放后的图像
+
+class ThumbnailLoader(QRunnable):
+    """在线程池中解码并缩放图像，避免阻塞GUI线程"""
+    
+    def __init__(self, image_path: str, size: QSize):
+        super().__init__()
+        self.image_path = image_path
+        self.size = size
+        self.signals = ThumbnailSignals()
+    
+    def run(self):
+        try:
+            stat = os.stat(self.image_path)
+        except OSError:
+            self.signals.loaded.emit(self.image_path, QImage())
+            return
+        image = _load_thumbnail(
+            self.image_path, stat.st_mtime_ns, stat.st_size,
+            self.size.width(), self.size.height()
+        )
+        self.signals.loaded.emit(self.image_path, image)
+
+class SaveSignals(QObject):
+    """文本保存信号"""
+    finished = pyqtSignal()  # 写盘结束（结果保存在任务对象上）
+
+class _SaveRunnable(QRunnable):
+    """在线程池中写入文本文件，避免磁盘IO阻塞GUI线程
+    
+    只写入.txt文件，不接触项目配置；文件路径的记录和project.json的保存
+    在GUI线程中完成，保证项目配置只有一个写入者。
+    """
+    
+    def __init__(self, files: Dict[str, Tuple[str, str]], hashes: Dict[str, int],
+                 project_dir: Optional[str]):
+        super().__init__()
+        # 由窗口持有引用并在GUI线程中读取结果
+        self.setAutoDelete(False)
+        self.files = files
+        self.hashes = hashes
+        # 发起保存时的项目目录，完成时据此确认项目未被切换
+        self.project_dir = project_dir
+        self.saved: Dict[str, str] = {}
+        self.error: Optional[str] = None
+        self.handled = False
+        self.signals = SaveSignals()
+    
+    def run(self):
+        try:
+            self.saved = ProjectManager.write_text_files(self.files)
+        except Exception as e:
+            self.error = str(e)
+        self.signals.finished.emit()
 
 class NewMainWindow(QMainWindow):
     """新的主窗口"""
     
+    # 无法读取的图像共用的占位图标（首次使用时创建）
+    _missing_icon: Optional[QIcon] = None
+    
+    @classmethod
+    def _get_missing_icon(cls) -> QIcon:
+        """获取缺失图像的占位图标"""
+        if cls._missing_icon is None:
+            pixmap = QPixmap(200, 150)
+            pixmap.fill(QColor("#9E9E9E"))
+            cls._missing_icon = QIcon(pixmap)
+        return cls._missing_icon
+    
     def __init__(self):
         super().__init__()
         
@@ -133,6 +375,58 @@ class NewMainWindow(QMainWindow):
         # 当前工作线程
         self.current_worker = None
         
+        # 项目状态刷新合并定时器，短时间内的多次请求只刷新一次
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(self.update_project_status)
+        # 上次显示的项目状态，未变化时跳过重建文本
+        self._last_rendered_status = None
+        # 上次设置到控件上的文本，相同时不再调用Qt
+        self._last_status_text = None
+        self._last_info_text = None
+        # 上次设置的进度值，None表示进度条当前隐藏
+        self._last_progress_value = None
+        self._last_rewrite_progress = None
+        self._last_placeholder = TEXT_PLACEHOLDER_EMPTY
+        
+        # 复用的新建项目对话框（首次使用时创建）
+        self._new_project_dialog: Optional[NewProjectDialog] = None
+        
+        # 复用的文件对话框（首次使用时创建）
+        self._file_dialogs: Dict[str, QFileDialog] = {}
+        
+        # 图像缩略图后台加载（路径 -> 等待设置图标的列表项）
+        self._icon_pool = QThreadPool.globalInstance()
+        self._pending_icons: Dict[str, List[QListWidgetItem]] = {}
+        
+        # 回收的图像列表项，重新加载时复用
+        self._item_pool: List[QListWidgetItem] = []
+        
+        # 图像列表分批填充，每次事件循环空闲时处理一批
+        self._pending_image_paths: deque = deque()
+        self._image_pump_timer = QTimer(self)
+        self._image_pump_timer.setSingleShot(True)
+        self._image_pump_timer.setInterval(0)
+        self._image_pump_timer.timeout.connect(self._pump_image_items)
+        
+        # 文本自动保存防抖定时器（需在创建文本框之前准备好）
+        self._disable_auto_save = False
+        # 各类文本上次写盘内容的哈希，内容未变化时跳过写盘
+        self._saved_hashes: Dict[str, int] = {}
+        # 输入文本快照（去除首尾空白），文档变化时置为None，按需重新生成
+        self._input_text_cache: Optional[str] = None
+        # 待写盘的文本（文本类型 -> 内容），同一类型只保留最新值，统一批量写入
+        self._pending_saves: Dict[str, str] = {}
+        # 单线程的保存线程池：写盘按提交顺序串行执行，同一时间只有一个保存任务
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        self._save_in_flight: Optional[_SaveRunnable] = None
+        self._autosave_timer = QTimer(self)
+        self._autosave_timer.setSingleShot(True)
+        self._autosave_timer.setInterval(_AUTOSAVE_DELAY_MS)
+        self._autosave_timer.timeout.connect(self._do_autosave)
+        
         # 初始化UI
         self.init_ui()
         
@@ -154,7 +448,7 @@ class NewMainWindow(QMainWindow):
     
     def init_ui(self):
         """初始化用户界面"""
-        self.setWindowTitle("AI 视频生成系统 - 重构版")
+        self.setWindowTitle(WINDOW_TITLE_FMT.format("重构版"))
         
         # 获取屏幕尺寸并设置合适的窗口大小
         screen = QApplication.desktop().screenGeometry()
@@ -312,6 +606,7 @@ class NewMainWindow(QMainWindow):
     def create_tabs(self, parent_layout):
         """创建标签页"""
         self.tab_widget = QTabWidget()
+        self._lazy_tabs: Dict[int, tuple] = {}
         
         # 文本处理标签页
         self.text_tab = self.create_text_tab()
@@ -320,6 +615,11 @@ class NewMainWindow(QMainWindow):
         # 分镜生成标签页（原版）
         self.storyboard_tab = self.create_storyboard_tab()
         self.tab_widget.addTab(self.storyboard_tab, "分镜生成")
+        # 缓存分镜标签页中需要频繁访问的控件引用
+        self._sb_text_input = getattr(self.storyboard_tab, 'text_input', None)
+        self._sb_output_text = getattr(self.storyboard_tab, 'output_text', None)
+        self._sb_rewrite_provider_combo = getattr(self.storyboard_tab, 'rewrite_provider_combo', None)
+        self._sb_style_combo = getattr(self.storyboard_tab, 'style_combo', None)
         
         # 五阶段分镜生成标签页（新版）
         self.five_stage_storyboard_tab = self.create_five_stage_storyboard_tab()
@@ -333,20 +633,56 @@ class NewMainWindow(QMainWindow):
         self.consistency_panel = ConsistencyControlPanel(None, self.project_manager, self)
         self.tab_widget.addTab(self.consistency_panel, "🎨 一致性控制")
         
-        # 视频生成标签页
-        self.video_tab = self.create_video_tab()
-        self.tab_widget.addTab(self.video_tab, "视频生成")
+        # 视频生成标签页（首次切换到该页时才构建）
+        self.video_tab = None
+        self._add_lazy_tab(self.create_video_tab, "视频生成", "video_tab")
         
         # 项目管理标签页
         self.project_tab = self.create_project_tab()
         self.tab_widget.addTab(self.project_tab, "项目管理")
         
-        # 设置标签页
-        self.settings_tab = self.create_settings_tab()
-        self.tab_widget.addTab(self.settings_tab, "设置")
+        # 设置标签页（首次切换到该页时才构建）
+        self.settings_tab = None
+        self._add_lazy_tab(self.create_settings_tab, "设置", "settings_tab")
+        
+        self.tab_widget.currentChanged.connect(self._materialize_tab)
         
         parent_layout.addWidget(self.tab_widget)
     
+    def _add_lazy_tab(self, builder: Callable[[], QWidget], title: str, attr_name: str):
+        """添加延迟构建的标签页，先放置空占位部件"""
+        index = self.tab_widget.addTab(QWidget(), title)
+        self._lazy_tabs[index] = (builder, title, attr_name)
+    
+    def _materialize_tab(self, index: int):
+        """构建尚未创建的标签页并替换占位部件"""
+        entry = self._lazy_tabs.pop(index, None)
+        if entry is None:
+            return
+        
+        builder, title, attr_name = entry
+        tab = builder()
+        setattr(self, attr_name, tab)
+        
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, tab, title)
+            self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+    
+    def _ensure_tab_built(self, attr_name: str):
+        """确保指定的延迟标签页已构建（供跨标签页访问控件时使用）"""
+        for index, (_, _, name) in list(self._lazy_tabs.items()):
+            if name == attr_name:
+                current = self.tab_widget.currentIndex()
+                self._materialize_tab(index)
+                self.tab_widget.setCurrentIndex(current)
+                return
+    
     def create_text_tab(self):
         """创建文本处理标签页"""
         tab = QWidget()
@@ -357,10 +693,12 @@ class NewMainWindow(QMainWindow):
         text_layout = QVBoxLayout(text_group)
         
         self.text_input = QTextEdit()
-        self.text_input.setPlaceholderText("请先创建项目，然后输入要转换为视频的文本内容...")
+        self.text_input.setPlaceholderText(TEXT_PLACEHOLDER_EMPTY)
         self.text_input.setMinimumHeight(200)
         # 连接文本变化信号，自动保存
         self.text_input.textChanged.connect(self.on_text_changed)
+        # 文档内容变化（包括屏蔽信号期间的程序修改）时使文本快照失效
+        self.text_input.document().contentsChanged.connect(self._invalidate_input_text)
         text_layout.addWidget(self.text_input)
         
         # 文本操作按钮
@@ -441,35 +779,17 @@ class NewMainWindow(QMainWindow):
         self.image_provider_combo = QComboBox()
         config_layout.addRow("图像提供商:", self.image_provider_combo)
         
+        # 数值参数（尺寸、步数、CFG Scale）
+        self._build_spin_boxes(_IMAGE_SPIN_SPECS)
+        
         # 图像尺寸
         size_layout = QHBoxLayout()
-        self.width_spin = QSpinBox()
-        self.width_spin.setRange(256, 2048)
-        self.width_spin.setValue(1024)
-        self.width_spin.setSingleStep(64)
         size_layout.addWidget(self.width_spin)
-        
         size_layout.addWidget(QLabel("×"))
-        
-        self.height_spin = QSpinBox()
-        self.height_spin.setRange(256, 2048)
-        self.height_spin.setValue(576)
-        self.height_spin.setSingleStep(64)
         size_layout.addWidget(self.height_spin)
-        
         config_layout.addRow("图像尺寸:", size_layout)
         
-        # 生成步数
-        self.steps_spin = QSpinBox()
-        self.steps_spin.setRange(10, 100)
-        self.steps_spin.setValue(20)
         config_layout.addRow("生成步数:", self.steps_spin)
-        
-        # CFG Scale
-        self.cfg_scale_spin = QDoubleSpinBox()
-        self.cfg_scale_spin.setRange(1.0, 20.0)
-        self.cfg_scale_spin.setValue(7.0)
-        self.cfg_scale_spin.setSingleStep(0.5)
         config_layout.addRow("CFG Scale:", self.cfg_scale_spin)
         
         # 负面提示词
@@ -502,6 +822,15 @@ class NewMainWindow(QMainWindow):
         
         return tab
     
+    def _build_spin_boxes(self, specs):
+        """按参数表批量创建数值输入框，并设置为同名属性"""
+        for attr_name, spin_class, minimum, maximum, value, step in specs:
+            spin = spin_class()
+            spin.setRange(minimum, maximum)
+            spin.setValue(value)
+            spin.setSingleStep(step)
+            setattr(self, attr_name, spin)
+    
     def create_video_tab(self):
         """创建视频生成标签页"""
         tab = QWidget()
@@ -511,17 +840,9 @@ class NewMainWindow(QMainWindow):
         config_group = QGroupBox("视频生成配置")
         config_layout = QFormLayout(config_group)
         
-        # 帧率
-        self.fps_spin = QSpinBox()
-        self.fps_spin.setRange(15, 60)
-        self.fps_spin.setValue(24)
+        # 帧率、每镜头时长
+        self._build_spin_boxes(_VIDEO_SPIN_SPECS)
         config_layout.addRow("帧率 (FPS):", self.fps_spin)
-        
-        # 每镜头时长
-        self.duration_spin = QDoubleSpinBox()
-        self.duration_spin.setRange(1.0, 10.0)
-        self.duration_spin.setValue(3.0)
-        self.duration_spin.setSingleStep(0.5)
         config_layout.addRow("每镜头时长 (秒):", self.duration_spin)
         
         # 转场效果
@@ -682,24 +1003,26 @@ class NewMainWindow(QMainWindow):
     
     def init_app_controller(self):
         """初始化应用控制器"""
-        def on_init_finished():
-            self.update_service_status()
-            self.update_providers()
-            self._init_consistency_processor()
-            self.status_label.setText("应用初始化完成")
-        
-        def on_init_error(error):
-            self.status_label.setText(f"初始化失败: {error}")
-            QMessageBox.critical(self, "初始化失败", f"应用初始化失败:\n{error}")
-        
         # 创建初始化工作线程
         self.init_worker = AsyncWorker(self.app_controller.initialize)
-        self.init_worker.signals.finished.connect(on_init_finished)
-        self.init_worker.signals.error.connect(on_init_error)
+        self.init_worker.signals.finished.connect(self._on_init_finished)
+        self.init_worker.signals.error.connect(self._on_init_error)
         self.init_worker.start()
         
         self.status_label.setText("正在初始化应用...")
     
+    def _on_init_finished(self, result):
+        """应用初始化完成（初始化结果不使用）"""
+        self.update_service_status()
+        self.update_providers()
+        self._init_consistency_processor()
+        self.status_label.setText("应用初始化完成")
+    
+    def _on_init_error(self, error):
+        """应用初始化失败"""
+        self.status_label.setText(f"初始化失败: {error}")
+        QMessageBox.critical(self, "初始化失败", f"应用初始化失败:\n{error}")
+    
     def update_service_status(self):
         """更新服务状态"""
         # 这里可以添加服务状态检查逻辑
@@ -723,13 +1046,18 @@ class NewMainWindow(QMainWindow):
             logger.error(f"更新提供商列表失败: {e}")
     
     def show_progress(self, progress: float, message: str):
-        """显示进度"""
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(int(progress * 100))
+        """显示进度（进度值未变化时不重复设置进度条）"""
+        value = int(progress * 100)
+        if value != self._last_progress_value:
+            if self._last_progress_value is None:
+                self.progress_bar.setVisible(True)
+            self.progress_bar.setValue(value)
+            self._last_progress_value = value
         self.status_label.setText(message)
     
     def hide_progress(self):
         """隐藏进度"""
+        self._last_progress_value = None
         self.progress_bar.setVisible(False)
         self.status_label.setText("就绪")
     
@@ -748,12 +1076,13 @@ class NewMainWindow(QMainWindow):
                 return
         
         # 显示新建项目对话框
-        dialog = NewProjectDialog(self)
+        dialog = self._get_new_project_dialog("新建项目")
         if dialog.exec_() == QDialog.Accepted:
             try:
                 project_info = dialog.get_project_info()
                 
                 # 创建新项目
+                self._wait_for_saves()
                 project_config = self.project_manager.create_new_project(
                     project_info["name"], 
                     project_info["description"]
@@ -769,13 +1098,13 @@ class NewMainWindow(QMainWindow):
                 self.save_current_content()
                 
                 # 更新项目状态显示
-                self.update_project_status()
+                self._schedule_status_update()
                 
                 # 显示成功消息
                 show_success(f"项目 '{project_info['name']}' 创建成功！")
                 
                 # 更新窗口标题
-                self.setWindowTitle(f"AI 视频生成系统 - {project_info['name']}")
+                self.setWindowTitle(WINDOW_TITLE_FMT.format(project_info['name']))
                 
                 # 更新文本框占位符
                 self.update_text_placeholder()
@@ -789,28 +1118,31 @@ class NewMainWindow(QMainWindow):
     def clear_all_content(self):
         """清空所有内容"""
         try:
-            # 暂时禁用自动保存
-            self._disable_auto_save = True
-            
             # 清空当前项目名称
             self.current_project_name = None
+            self._saved_hashes.clear()
+            self._pending_saves.clear()
             
-            # 清空文本输入
-            self.text_input.clear()
+            # 清空文本输入（屏蔽信号，不触发自动保存）
+            blocker = QSignalBlocker(self.text_input)
+            try:
+                self.text_input.clear()
+            finally:
+                blocker.unblock()
             self.rewritten_text.clear()
             
             # 清空分镜数据
-            if hasattr(self, 'storyboard_tab'):
-                if hasattr(self.storyboard_tab, 'text_input'):
-                    self.storyboard_tab.text_input.clear()
-                if hasattr(self.storyboard_tab, 'output_text'):
-                    self.storyboard_tab.output_text.clear()
+            if self._sb_text_input is not None:
+                self._sb_text_input.clear()
+            if self._sb_output_text is not None:
+                self._sb_output_text.clear()
             
-            # 清空图像列表
-            self.image_list.clear()
+            # 清空图像列表（丢弃尚未添加的图像和尚未完成的缩略图回填）
+            self._reset_image_list()
             
-            # 重置视频信息
-            self.video_info_label.setText("暂无视频")
+            # 重置视频信息（视频标签页未构建时无需处理）
+            if self.video_tab is not None:
+                self.video_info_label.setText("暂无视频")
             
             # 清空应用控制器
             self.app_controller.clear_project()
@@ -818,27 +1150,24 @@ class NewMainWindow(QMainWindow):
             # 更新文本框占位符
             self.update_text_placeholder()
             
-            # 重新启用自动保存
-            self._disable_auto_save = False
-            
         except Exception as e:
             logger.error(f"清空内容失败: {e}")
-            self._disable_auto_save = False
     
     def open_project(self):
         """打开项目"""
         try:
-            # 获取项目列表
-            projects = self.project_manager.list_projects()
-            
-            # 显示打开项目对话框
-            dialog = OpenProjectDialog(projects, self)
+            # 显示打开项目对话框，项目列表在后台加载
+            dialog = OpenProjectDialog(parent=self, list_projects=self.project_manager.list_projects)
             if dialog.exec_() == QDialog.Accepted:
                 selected_project = dialog.get_selected_project()
                 if selected_project:
                     try:
                         # 加载项目
-                        project_config = self.project_manager.load_project(selected_project["path"])
+                        self._wait_for_saves()
+                        project_config = self.project_manager.load_project(
+                            selected_project["path"],
+                            prefetched=dialog.get_prefetched_config(selected_project["path"])
+                        )
                         
                         # 验证项目数据完整性
                         self._validate_project_data(project_config)
@@ -860,11 +1189,11 @@ class NewMainWindow(QMainWindow):
                         self._load_complex_components(project_config)
                         
                         # 更新项目状态
-                        self.update_project_status()
+                        self._schedule_status_update()
                         
                         # 更新窗口标题
                         project_display_name = project_config.get('project_name') or project_config.get('name', '未知项目')
-                        self.setWindowTitle(f"AI 视频生成系统 - {project_display_name}")
+                        self.setWindowTitle(WINDOW_TITLE_FMT.format(project_display_name))
                         
                         # 更新文本框占位符
                         self.update_text_placeholder()
@@ -873,17 +1202,15 @@ class NewMainWindow(QMainWindow):
                         project_display_name = project_config.get('project_name') or project_config.get('name', '未知项目')
                         show_success(f"项目 '{project_display_name}' 加载成功！")
                         
-                        # 强制刷新界面
-                        self.repaint()
+                        # 请求刷新界面（由Qt合并到下一帧绘制）
+                        self.update()
                         
                         project_display_name = project_config.get('project_name') or project_config.get('name', '未知项目')
                         logger.info(f"项目加载成功: {project_display_name}")
                         
                     except Exception as e:
                         QMessageBox.critical(self, "错误", f"加载项目失败：{e}")
-                        logger.error(f"加载项目失败: {e}")
-                        import traceback
-                        logger.error(f"详细错误信息: {traceback.format_exc()}")
+                        logger.exception(f"加载项目失败: {e}")
                         
         except Exception as e:
             QMessageBox.critical(self, "错误", f"打开项目失败：{e}")
@@ -891,10 +1218,9 @@ class NewMainWindow(QMainWindow):
     
     def load_project_content(self, project_config):
         """加载项目内容到界面"""
+        # 加载期间屏蔽文本框信号，不触发自动保存
+        blocker = QSignalBlocker(self.text_input)
         try:
-            # 暂时禁用自动保存
-            self._disable_auto_save = True
-            
             files = project_config.get("files", {})
             logger.info(f"加载项目文件信息: {files}")
             
@@ -905,10 +1231,10 @@ class NewMainWindow(QMainWindow):
                 logger.info(f"尝试加载原始文本: {original_file}")
                 if original_file.exists():
                     try:
-                        with open(original_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            self.text_input.setPlainText(content)
-                            logger.info(f"原始文本加载成功，长度: {len(content)}")
+                        content = _read_text_cached(original_file)
+                        self.text_input.setPlainText(content)
+                        self._saved_hashes["original_text"] = hash(content.strip())
+                        logger.info(f"原始文本加载成功，长度: {len(content)}")
                     except Exception as e:
                         logger.error(f"读取原始文本文件失败: {e}")
                 else:
@@ -923,10 +1249,10 @@ class NewMainWindow(QMainWindow):
                 logger.info(f"尝试加载改写文本: {rewritten_file}")
                 if rewritten_file.exists():
                     try:
-                        with open(rewritten_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            self.rewritten_text.setPlainText(content)
-                            logger.info(f"改写文本加载成功，长度: {len(content)}")
+                        content = _read_text_cached(rewritten_file)
+                        self.rewritten_text.setPlainText(content)
+                        self._saved_hashes["rewritten_text"] = hash(content.strip())
+                        logger.info(f"改写文本加载成功，长度: {len(content)}")
                     except Exception as e:
                         logger.error(f"读取改写文本文件失败: {e}")
                 else:
@@ -937,41 +1263,102 @@ class NewMainWindow(QMainWindow):
             # 加载图像
             if files.get("images"):
                 logger.info(f"加载图像列表: {files['images']}")
+                existing = _existing_paths(files["images"])
                 for image_path in files["images"]:
-                    if Path(image_path).exists():
-                        self.add_image_to_list(image_path)
+                    if str(image_path) in existing:
+                        self._pending_image_paths.append(image_path)
                     else:
                         logger.warning(f"图像文件不存在: {image_path}")
+                # 分批添加，避免大量图像时阻塞界面
+                if self._pending_image_paths:
+                    self._image_pump_timer.start()
             
             logger.info("项目内容加载完成")
             
-            # 重新启用自动保存
-            self._disable_auto_save = False
-            
         except Exception as e:
-            logger.error(f"加载项目内容失败: {e}")
-            import traceback
-            logger.error(f"错误详情: {traceback.format_exc()}")
-            # 确保重新启用自动保存
-            self._disable_auto_save = False
+            logger.exception(f"加载项目内容失败: {e}")
+        finally:
+            blocker.unblock()
     
     def add_image_to_list(self, image_path):
-        """添加图像到列表"""
+        """添加图像到列表（缩略图在后台线程生成后再设置图标）"""
         try:
-            item = QListWidgetItem()
-            pixmap = QPixmap(image_path)
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(200, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                item.setIcon(QIcon(scaled_pixmap))
-            
-            filename = Path(image_path).name
-            item.setText(filename)
-            item.setToolTip(str(image_path))
-            self.image_list.addItem(item)
-            
+            self.image_list.addItem(self._create_image_item(image_path))
         except Exception as e:
             logger.error(f"添加图像到列表失败: {e}")
     
+    def _create_image_item(self, image_path) -> QListWidgetItem:
+        """创建图像列表项并提交缩略图加载任务"""
+        item = self._take_image_item()
+        item.setText(Path(image_path).name)
+        item.setToolTip(str(image_path))
+        self._request_thumbnail(item, str(image_path))
+        return item
+    
+    def _request_thumbnail(self, item: QListWidgetItem, image_path: str):
+        """提交缩略图加载任务，同一路径只解码一次"""
+        pending = self._pending_icons.setdefault(image_path, [])
+        pending.append(item)
+        if len(pending) == 1:
+            loader = ThumbnailLoader(image_path, self.image_list.iconSize())
+            loader.signals.loaded.connect(self._install_icon)
+            self._icon_pool.start(loader)
+    
+    def _take_image_item(self) -> QListWidgetItem:
+        """从对象池取出列表项，池为空时新建"""
+        if self._item_pool:
+            item = self._item_pool.pop()
+            item.setIcon(QIcon())
+            return item
+        return QListWidgetItem()
+    
+    def _reset_image_list(self):
+        """清空图像列表，列表项回收到对象池以便复用"""
+        self._image_pump_timer.stop()
+        self._pending_image_paths.clear()
+        self._pending_icons.clear()
+        
+        self.image_list.setUpdatesEnabled(False)
+        try:
+            # 从末尾取出，避免每次移除都移动后续行
+            for row in range(self.image_list.count() - 1, -1, -1):
+                self._item_pool.append(self.image_list.takeItem(row))
+        finally:
+            self.image_list.setUpdatesEnabled(True)
+    
+    def _pump_image_items(self):
+        """添加一批待加载的图像，剩余的留到下一次事件循环"""
+        batch = []
+        while self._pending_image_paths and len(batch) < _IMAGE_BATCH_SIZE:
+            batch.append(self._create_image_item(self._pending_image_paths.popleft()))
+        self._add_image_items(batch)
+        
+        if self._pending_image_paths:
+            self._image_pump_timer.start()
+    
+    def _add_image_items(self, items: List[QListWidgetItem]):
+        """批量添加列表项，期间暂停重绘和信号，结束后统一刷新一次"""
+        if not items:
+            return
+        self.image_list.setUpdatesEnabled(False)
+        self.image_list.blockSignals(True)
+        try:
+            for item in items:
+                self.image_list.addItem(item)
+        finally:
+            self.image_list.blockSignals(False)
+            self.image_list.setUpdatesEnabled(True)
+    
+    def _install_icon(self, image_path: str, image: QImage):
+        """缩略图加载完成后在GUI线程设置图标"""
+        items = self._pending_icons.pop(image_path, [])
+        if image.isNull():
+            icon = self._get_missing_icon()
+        else:
+            icon = QIcon(QPixmap.fromImage(image))
+        for item in items:
+            item.setIcon(icon)
+    
     def save_project(self):
         """保存项目"""
         try:
@@ -981,6 +1368,7 @@ class NewMainWindow(QMainWindow):
             
             # 保存当前界面内容到项目
             self.save_current_content()
+            self._wait_for_saves()
             
             # 保存项目
             if self.project_manager.save_project():
@@ -994,31 +1382,43 @@ class NewMainWindow(QMainWindow):
             QMessageBox.critical(self, "错误", f"保存项目失败：{e}")
             logger.error(f"保存项目失败: {e}")
     
+    def _invalidate_input_text(self):
+        """文本框内容变化，丢弃文本快照"""
+        self._input_text_cache = None
+    
+    def _input_text(self) -> str:
+        """获取输入文本快照（已去除首尾空白），每次编辑后只复制一次文档"""
+        if self._input_text_cache is None:
+            self._input_text_cache = self.text_input.toPlainText().strip()
+        return self._input_text_cache
+    
     def on_text_changed(self):
-        """文本内容变化时自动保存"""
+        """文本内容变化时自动保存（防抖，停止输入后才真正处理）"""
+        # 检查是否禁用自动保存
+        if self._disable_auto_save:
+            return
+        
+        # 没有项目且文本为空时无需处理（isEmpty为O(1)，不复制整个文档）
+        if not self.project_manager.current_project and self.text_input.document().isEmpty():
+            return
+        
+        # start()会重新计时，连续输入只在停止输入后触发一次
+        self._autosave_timer.start()
+    
+    def _do_autosave(self):
+        """防抖结束后执行自动保存"""
         try:
-            # 检查是否禁用自动保存
-            if getattr(self, '_disable_auto_save', False):
+            if self._disable_auto_save:
                 return
             
-            # 检查是否有当前项目，如果没有且有文本内容，强制创建项目
-            if hasattr(self, 'project_manager'):
-                text_content = self.text_input.toPlainText().strip()
-                
-                if not self.project_manager.current_project and text_content:
-                    # 用户输入了内容但没有项目，强制创建项目
+            if not self.project_manager.current_project:
+                # 用户输入了内容但没有项目，强制创建项目
+                # 先用isEmpty快速排除空文档，仅在有内容时才取出全文判断是否全为空白
+                if not self.text_input.document().isEmpty() and self._input_text():
                     self.force_create_project()
-                    return
-                
-                if self.project_manager.current_project:
-                    # 延迟保存，避免频繁保存
-                    if hasattr(self, '_save_timer'):
-                        self._save_timer.stop()
-                    
-                    self._save_timer = QTimer()
-                    self._save_timer.setSingleShot(True)
-                    self._save_timer.timeout.connect(self.auto_save_original_text)
-                    self._save_timer.start(2000)  # 2秒后保存
+                return
+            
+            self.auto_save_original_text()
         except Exception as e:
             logger.error(f"文本变化处理失败: {e}")
     
@@ -1029,7 +1429,7 @@ class NewMainWindow(QMainWindow):
             self._disable_auto_save = True
             
             # 获取当前文本内容
-            current_text = self.text_input.toPlainText().strip()
+            current_text = self._input_text()
             
             QMessageBox.information(
                 self, 
@@ -1038,8 +1438,7 @@ class NewMainWindow(QMainWindow):
             )
             
             # 显示新建项目对话框
-            dialog = NewProjectDialog(self)
-            dialog.setWindowTitle("创建项目 - 必需")
+            dialog = self._get_new_project_dialog("创建项目 - 必需")
             
             # 循环直到用户创建项目或清空文本
             while True:
@@ -1059,15 +1458,16 @@ class NewMainWindow(QMainWindow):
                         # 保存当前文本到项目
                         if current_text:
                             self.project_manager.save_text_content(current_text, "original_text")
+                            self._saved_hashes["original_text"] = hash(current_text)
                         
                         # 更新项目状态显示
-                        self.update_project_status()
+                        self._schedule_status_update()
                         
                         # 显示成功消息
                         show_success(f"项目 '{project_info['name']}' 创建成功！文本内容已保存。")
                         
                         # 更新窗口标题
-                        self.setWindowTitle(f"AI 视频生成系统 - {project_info['name']}")
+                        self.setWindowTitle(WINDOW_TITLE_FMT.format(project_info['name']))
                         
                         # 更新文本框占位符
                         self.update_text_placeholder()
@@ -1114,11 +1514,13 @@ class NewMainWindow(QMainWindow):
             if self.project_manager.current_project:
                 # 兼容新旧项目格式
                 project_name = self.project_manager.current_project.get("project_name") or self.project_manager.current_project.get("name", "当前项目")
-                placeholder = f"项目：{project_name}\n请输入要转换为视频的文本内容..."
+                placeholder = TEXT_PLACEHOLDER_PROJECT_FMT.format(project_name)
             else:
-                placeholder = "请先创建项目，然后输入要转换为视频的文本内容..."
+                placeholder = TEXT_PLACEHOLDER_EMPTY
             
-            self.text_input.setPlaceholderText(placeholder)
+            if placeholder != self._last_placeholder:
+                self.text_input.setPlaceholderText(placeholder)
+                self._last_placeholder = placeholder
             
         except Exception as e:
             logger.error(f"更新文本占位符失败: {e}")
@@ -1127,28 +1529,116 @@ class NewMainWindow(QMainWindow):
         """自动保存原始文本"""
         try:
             if self.project_manager.current_project:
-                original_text = self.text_input.toPlainText().strip()
+                original_text = self._input_text()
                 if original_text:
-                    self.project_manager.save_text_content(original_text, "original_text")
+                    # 内容与上次保存一致时跳过写盘
+                    self._pending_saves["original_text"] = original_text
+                    self._flush_pending_saves()
                     logger.debug("原始文本已自动保存")
         except Exception as e:
             logger.error(f"自动保存原始文本失败: {e}")
     
+    def _flush_pending_saves(self):
+        """将待保存的文本一次性批量写入项目，项目配置只保存一次"""
+        if not self._pending_saves or not self.project_manager.current_project:
+            return
+        
+        # 上一次保存尚未完成时先累积，完成后再合并写入，避免任务无限排队
+        if self._save_in_flight is not None:
+            return
+        
+        pending, self._pending_saves = self._pending_saves, {}
+        
+        # 与上次保存内容一致的文本跳过写盘
+        changed = {}
+        hashes = {}
+        for text_type, content in pending.items():
+            text_hash = hash(content)
+            if text_hash != self._saved_hashes.get(text_type):
+                changed[text_type] = content
+                hashes[text_type] = text_hash
+        
+        if not changed:
+            return
+        
+        # 文件路径在GUI线程中确定，工作线程只负责写盘
+        try:
+            files = {
+                text_type: (self.project_manager.get_text_file_path(text_type), content)
+                for text_type, content in changed.items()
+            }
+        except Exception as e:
+            logger.error(f"保存文本内容失败: {e}")
+            return
+        
+        # 先记录哈希，保存期间相同内容不会重复提交；失败时再撤销
+        self._saved_hashes.update(hashes)
+        runnable = _SaveRunnable(
+            files, hashes, self.project_manager.current_project.get("project_dir")
+        )
+        runnable.signals.finished.connect(partial(self._on_save_done, runnable))
+        self._save_in_flight = runnable
+        self._save_pool.start(runnable)
+    
+    def _on_save_done(self, runnable: _SaveRunnable):
+        """写盘结束：在GUI线程中记录文件路径并保存项目配置"""
+        if runnable.handled:
+            # 已在_wait_for_saves中处理
+            return
+        runnable.handled = True
+        if self._save_in_flight is runnable:
+            self._save_in_flight = None
+        
+        current_project = self.project_manager.current_project
+        current_dir = current_project.get("project_dir") if current_project else None
+        if runnable.error is None and current_dir != runnable.project_dir:
+            # 保存期间项目已切换，不能把旧项目的文件路径写入当前项目配置
+            runnable.error = f"保存期间项目已切换，未记录到项目配置: {runnable.project_dir}"
+        
+        if runnable.error is None:
+            try:
+                if not self.project_manager.record_text_files(runnable.saved):
+                    runnable.error = "保存项目配置失败"
+            except Exception as e:
+                runnable.error = str(e)
+        
+        if runnable.error is None:
+            logger.debug(f"文本已保存: {', '.join(runnable.saved)}")
+        else:
+            # 撤销记录的哈希以便下次重试
+            for text_type, text_hash in runnable.hashes.items():
+                if self._saved_hashes.get(text_type) == text_hash:
+                    del self._saved_hashes[text_type]
+            logger.error(f"保存文本内容失败: {runnable.error}")
+        
+        self._flush_pending_saves()
+    
+    def _wait_for_saves(self):
+        """等待后台写盘完成并记录结果（切换项目、保存项目配置及退出前调用）"""
+        if self._save_in_flight is None and self._pending_saves:
+            self._flush_pending_saves()
+        while self._save_in_flight is not None:
+            runnable = self._save_in_flight
+            self._save_pool.waitForDone()
+            # 完成信号尚在排队，这里直接处理；处理时会提交期间累积的文本
+            self._on_save_done(runnable)
+    
     def save_current_content(self):
         """保存当前界面内容到项目"""
         try:
             if not self.project_manager.current_project:
                 return
             
-            # 保存原始文本
-            original_text = self.text_input.toPlainText().strip()
+            # 原始文本和改写后的文本合并为一次批量写入
+            original_text = self._input_text()
             if original_text:
-                self.project_manager.save_text_content(original_text, "original_text")
+                self._pending_saves["original_text"] = original_text
             
-            # 保存改写后的文本
             rewritten_text = self.rewritten_text.toPlainText().strip()
             if rewritten_text:
-                self.project_manager.save_text_content(rewritten_text, "rewritten_text")
+                self._pending_saves["rewritten_text"] = rewritten_text
+            
+            self._flush_pending_saves()
             
             # 触发一致性面板保存预览数据
             if hasattr(self, 'consistency_panel') and self.consistency_panel:
@@ -1183,15 +1673,27 @@ class NewMainWindow(QMainWindow):
             else:
                 return
         
-        file_path, _ = QFileDialog.getOpenFileName(self, "选择文本文件", "", "文本文件 (*.txt *.md)")
+        file_path = self._exec_file_dialog("text", "选择文本文件", QFileDialog.ExistingFile, "文本文件 (*.txt *.md)")
         if file_path:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                self.text_input.setPlainText(content)
+                content = _read_text_file(file_path)
+                # 程序设置文本时屏蔽信号，下面直接保存，不再触发防抖自动保存
+                blocker = QSignalBlocker(self.text_input)
+                try:
+                    self.text_input.setPlainText(content)
+                finally:
+                    blocker.unblock()
+                self._autosave_timer.stop()
+                
+                # 丢弃被替换掉的旧文本，并等待进行中的后台保存，避免与下面的写入交错
+                self._pending_saves.pop("original_text", None)
+                self._wait_for_saves()
                 
                 # 自动保存到项目
                 self.project_manager.save_text_content(content, "original_text")
+                self._saved_hashes["original_text"] = hash(content.strip())
+                # 文本框已持有一份副本，尽早释放读取的字符串
+                del content
                 
                 self.status_label.setText(f"文本文件已加载并保存到项目: {file_path}")
                 show_success("文本文件加载成功并已保存到项目！")
@@ -1199,9 +1701,25 @@ class NewMainWindow(QMainWindow):
             except Exception as e:
                 QMessageBox.critical(self, "加载失败", f"无法加载文本文件:\n{e}")
     
+    def _selected_llm_provider(self) -> Optional[str]:
+        """分镜标签页中选择的LLM提供商，"自动选择"时返回None"""
+        combo = self._sb_rewrite_provider_combo
+        if combo is None:
+            return None
+        provider = combo.currentText()
+        return provider if provider != "自动选择" else None
+    
+    def _selected_style(self) -> str:
+        """分镜标签页中选择的风格，没有风格选择框时使用配置中的默认风格"""
+        if self._sb_style_combo is not None:
+            return self._sb_style_combo.currentText()
+        from utils.config_manager import ConfigManager
+        config_manager = ConfigManager()
+        return config_manager.get_setting("default_style", "电影风格")
+    
     def rewrite_text(self):
         """AI改写文本"""
-        text = self.text_input.toPlainText().strip()
+        text = self._input_text()
         if not text:
             QMessageBox.warning(self, "警告", "请先输入文本内容")
             return
@@ -1220,57 +1738,78 @@ class NewMainWindow(QMainWindow):
             else:
                 return
         
-        def on_rewrite_finished(result):
-            self.rewritten_text.setPlainText(result)
-            
-            # 自动保存改写后的文本到项目
-            try:
-                if self.project_manager.current_project:
-                    self.project_manager.save_text_content(result, "rewritten_text")
-                    logger.info("改写后的文本已自动保存到项目")
-            except Exception as e:
-                logger.error(f"保存改写文本失败: {e}")
-            
-            # 隐藏进度条
-            self.rewrite_progress.setVisible(False)
-            self.hide_progress()
-            # 更新左下角状态显示
-            self.status_label.setText("✅ 文本改写完成")
-            show_success("文本改写已完成！改写后的内容已显示在下方文本框中。")
-            
-            # 同步到分镜标签页
-            if hasattr(self, 'storyboard_tab') and hasattr(self.storyboard_tab, 'load_rewritten_text_from_main'):
-                self.storyboard_tab.load_rewritten_text_from_main()
-        
-        def on_rewrite_error(error):
-            # 隐藏进度条
-            self.rewrite_progress.setVisible(False)
-            self.hide_progress()
-            # 更新左下角状态显示
-            self.status_label.setText("❌ 文本改写失败")
-            QMessageBox.critical(self, "改写失败", f"文本改写失败:\n{error}")
-        
-        def on_progress(progress, message):
-            # 显示和更新进度条
-            self.rewrite_progress.setVisible(True)
-            self.rewrite_progress.setValue(progress)
-            self.rewrite_progress.setFormat(f"正在改写文本... {progress}%")
-            # 更新左下角状态显示
-            self.status_label.setText(f"🔄 正在改写文章...")
-            self.show_progress(progress, message)
-        
         # 显示进度条
+        self._last_rewrite_progress = None
         self.rewrite_progress.setVisible(True)
         self.rewrite_progress.setValue(0)
         self.rewrite_progress.setFormat("准备改写文本...")
         
         # 创建改写工作线程
-        provider = self.storyboard_tab.rewrite_provider_combo.currentText() if hasattr(self, 'storyboard_tab') and hasattr(self.storyboard_tab, 'rewrite_provider_combo') and self.storyboard_tab.rewrite_provider_combo.currentText() != "自动选择" else None
-        self.current_worker = AsyncWorker(self.app_controller.rewrite_text, text, provider)
-        self.current_worker.signals.finished.connect(on_rewrite_finished)
-        self.current_worker.signals.error.connect(on_rewrite_error)
-        self.current_worker.signals.progress.connect(on_progress)
-        self.current_worker.start()
+        provider = self._selected_llm_provider()
+        self._launch_worker(
+            self.app_controller.rewrite_text, (text, provider),
+            self._on_rewrite_finished, self._on_rewrite_error, self._on_rewrite_progress
+        )
+    
+    def _launch_worker(self, coro, args: tuple, on_finished: Callable, on_error: Callable,
+                       on_progress: Optional[Callable] = None):
+        """创建并启动异步任务，结果通过绑定方法回调"""
+        worker = AsyncWorker(coro, *args)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.error.connect(on_error)
+        if on_progress is not None:
+            worker.signals.progress.connect(on_progress)
+        self.current_worker = worker
+        worker.start()
+    
+    def _on_worker_error(self, kind: str, error: str):
+        """异步任务失败的通用处理"""
+        self.hide_progress()
+        title, message = _WORKER_ERROR_MESSAGES[kind]
+        QMessageBox.critical(self, title, f"{message}:\n{error}")
+    
+    def _on_rewrite_finished(self, result):
+        """文本改写完成"""
+        self.rewritten_text.setPlainText(result)
+        
+        # 自动保存改写后的文本到项目
+        try:
+            if self.project_manager.current_project:
+                self._pending_saves["rewritten_text"] = result
+                self._flush_pending_saves()
+                logger.info("改写后的文本已自动保存到项目")
+        except Exception as e:
+            logger.error(f"保存改写文本失败: {e}")
+        
+        # 隐藏进度条
+        self.rewrite_progress.setVisible(False)
+        self.hide_progress()
+        # 更新左下角状态显示
+        self.status_label.setText("✅ 文本改写完成")
+        show_success("文本改写已完成！改写后的内容已显示在下方文本框中。")
+        
+        # 同步到分镜标签页
+        if hasattr(self, 'storyboard_tab') and hasattr(self.storyboard_tab, 'load_rewritten_text_from_main'):
+            self.storyboard_tab.load_rewritten_text_from_main()
+    
+    def _on_rewrite_error(self, error):
+        """文本改写失败"""
+        # 隐藏进度条
+        self.rewrite_progress.setVisible(False)
+        self.hide_progress()
+        # 更新左下角状态显示
+        self.status_label.setText("❌ 文本改写失败")
+        QMessageBox.critical(self, "改写失败", f"文本改写失败:\n{error}")
+    
+    def _on_rewrite_progress(self, progress, message):
+        """文本改写进度"""
+        # 进度未变化时不重复设置进度条（进度条在开始改写时已显示）
+        if progress != self._last_rewrite_progress:
+            self._last_rewrite_progress = progress
+            self.rewrite_progress.setValue(progress)
+            self.rewrite_progress.setFormat(f"正在改写文本... {progress}%")
+        # 左下角状态由show_progress更新
+        self.show_progress(progress, message)
     
     def clear_text(self):
         """清空文本"""
@@ -1279,34 +1818,18 @@ class NewMainWindow(QMainWindow):
     
     def quick_generate_video(self):
         """一键生成视频"""
-        text = self.text_input.toPlainText().strip()
+        text = self._input_text()
         if not text:
             QMessageBox.warning(self, "警告", "请先输入文本内容")
             return
         
-        def on_generate_finished(result):
-            self.hide_progress()
-            self.video_info_label.setText(f"视频已生成: {result}")
-            self.update_project_status()
-            self.status_label.setText("视频生成完成")
-            QMessageBox.information(self, "生成完成", f"视频已生成:\n{result}")
-        
-        def on_generate_error(error):
-            self.hide_progress()
-            QMessageBox.critical(self, "生成失败", f"视频生成失败:\n{error}")
-        
-        def on_progress(progress, message):
-            self.show_progress(progress, message)
+        # 需要读取视频标签页中的配置
+        self._ensure_tab_built("video_tab")
         
         # 准备配置
-        if hasattr(self, 'storyboard_tab') and hasattr(self.storyboard_tab, 'style_combo'):
-            style = self.storyboard_tab.style_combo.currentText()
-        else:
-            from utils.config_manager import ConfigManager
-            config_manager = ConfigManager()
-            style = config_manager.get_setting("default_style", "电影风格")
+        style = self._selected_style()
         providers = {
-            "llm": self.storyboard_tab.rewrite_provider_combo.currentText() if hasattr(self, 'storyboard_tab') and hasattr(self.storyboard_tab, 'rewrite_provider_combo') and self.storyboard_tab.rewrite_provider_combo.currentText() != "自动选择" else None,
+            "llm": self._selected_llm_provider(),
             "image": self.image_provider_combo.currentText() if self.image_provider_combo.currentText() else None
         }
         
@@ -1327,49 +1850,42 @@ class NewMainWindow(QMainWindow):
         )
         
         # 创建生成工作线程
-        self.current_worker = AsyncWorker(
+        self._launch_worker(
             self.app_controller.create_video_from_text,
-            text, style, image_config, video_config, providers, on_progress
+            (text, style, image_config, video_config, providers, self.show_progress),
+            self._on_generate_finished, partial(self._on_worker_error, "generate")
         )
-        self.current_worker.signals.finished.connect(on_generate_finished)
-        self.current_worker.signals.error.connect(on_generate_error)
-        self.current_worker.start()
+    
+    def _on_generate_finished(self, result):
+        """一键生成视频完成"""
+        self.hide_progress()
+        self.video_info_label.setText(f"视频已生成: {result}")
+        self._schedule_status_update()
+        self.status_label.setText("视频生成完成")
+        QMessageBox.information(self, "生成完成", f"视频已生成:\n{result}")
     
     def generate_storyboard(self):
         """生成分镜"""
-        text = self.text_input.toPlainText().strip()
+        text = self._input_text()
         if not text:
             QMessageBox.warning(self, "警告", "请先输入文本内容")
             return
         
-        def on_storyboard_finished(result):
-            self.display_storyboard(result)
-            self.hide_progress()
-            self.update_project_status()
-            self.status_label.setText("分镜生成完成")
-        
-        def on_storyboard_error(error):
-            self.hide_progress()
-            QMessageBox.critical(self, "生成失败", f"分镜生成失败:\n{error}")
-        
-        def on_progress(progress, message):
-            self.show_progress(progress, message)
-        
-        if hasattr(self, 'storyboard_tab') and hasattr(self.storyboard_tab, 'style_combo'):
-            style = self.storyboard_tab.style_combo.currentText()
-        else:
-            from utils.config_manager import ConfigManager
-            config_manager = ConfigManager()
-            style = config_manager.get_setting("default_style", "电影风格")
-        provider = self.storyboard_tab.rewrite_provider_combo.currentText() if hasattr(self, 'storyboard_tab') and hasattr(self.storyboard_tab, 'rewrite_provider_combo') and self.storyboard_tab.rewrite_provider_combo.currentText() != "自动选择" else None
+        style = self._selected_style()
+        provider = self._selected_llm_provider()
         
-        self.current_worker = AsyncWorker(
+        self._launch_worker(
             self.app_controller.generate_storyboard_only,
-            text, style, provider, on_progress
+            (text, style, provider, self.show_progress),
+            self._on_storyboard_finished, partial(self._on_worker_error, "storyboard")
         )
-        self.current_worker.signals.finished.connect(on_storyboard_finished)
-        self.current_worker.signals.error.connect(on_storyboard_error)
-        self.current_worker.start()
+    
+    def _on_storyboard_finished(self, result):
+        """分镜生成完成"""
+        self.display_storyboard(result)
+        self.hide_progress()
+        self._schedule_status_update()
+        self.status_label.setText("分镜生成完成")
     
     def display_storyboard(self, storyboard: StoryboardResult):
         """显示分镜"""
@@ -1406,10 +1922,10 @@ class NewMainWindow(QMainWindow):
                     format_type = "markdown"
                 
                 storyboard = self.app_controller.current_project["storyboard"]
-                content = self.app_controller.text_processor.export_storyboard(storyboard, format_type)
                 
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                # 边生成边写入大缓冲区，不在内存中拼出完整的导出内容
+                with open(file_path, 'w', encoding='utf-8', buffering=_EXPORT_BUFFER_SIZE) as f:
+                    self.app_controller.text_processor.write_storyboard(storyboard, f, format_type)
                 
                 self.status_label.setText(f"分镜已导出: {file_path}")
                 
@@ -1423,19 +1939,6 @@ class NewMainWindow(QMainWindow):
             QMessageBox.warning(self, "警告", "请先生成分镜")
             return
         
-        def on_images_finished(result):
-            self.display_images(result)
-            self.hide_progress()
-            self.update_project_status()
-            self.status_label.setText(f"图像生成完成，成功 {result.success_count} 张")
-        
-        def on_images_error(error):
-            self.hide_progress()
-            QMessageBox.critical(self, "生成失败", f"图像生成失败:\n{error}")
-        
-        def on_progress(progress, message):
-            self.show_progress(progress, message)
-        
         config = ImageGenerationConfig(
             provider=self.image_provider_combo.currentText(),
             width=self.width_spin.value(),
@@ -1445,28 +1948,32 @@ class NewMainWindow(QMainWindow):
             negative_prompt=self.negative_prompt_edit.text()
         )
         
-        self.current_worker = AsyncWorker(
+        self._launch_worker(
             self.app_controller.generate_images_only,
-            None, config, on_progress
+            (None, config, self.show_progress),
+            self._on_images_finished, partial(self._on_worker_error, "images")
         )
-        self.current_worker.signals.finished.connect(on_images_finished)
-        self.current_worker.signals.error.connect(on_images_error)
-        self.current_worker.start()
+    
+    def _on_images_finished(self, result):
+        """图像生成完成"""
+        self.display_images(result)
+        self.hide_progress()
+        self._schedule_status_update()
+        self.status_label.setText(f"图像生成完成，成功 {result.success_count} 张")
     
     def display_images(self, image_results: BatchImageResult):
         """显示图像"""
-        self.image_list.clear()
+        self._reset_image_list()
         
+        # 缩略图在线程池中解码，无法读取的图像显示占位图标
+        items = []
         for result in image_results.results:
-            if os.path.exists(result.image_path):
-                item = QListWidgetItem()
-                pixmap = QPixmap(result.image_path)
-                if not pixmap.isNull():
-                    scaled_pixmap = pixmap.scaled(200, 150, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                    item.setIcon(QIcon(scaled_pixmap))
-                item.setText(f"镜头 {result.shot_id}")
-                item.setToolTip(result.prompt)
-                self.image_list.addItem(item)
+            item = self._take_image_item()
+            item.setText(f"镜头 {result.shot_id}")
+            item.setToolTip(result.prompt)
+            self._request_thumbnail(item, result.image_path)
+            items.append(item)
+        self._add_image_items(items)
     
     def view_images(self):
         """查看图像"""
@@ -1478,8 +1985,9 @@ class NewMainWindow(QMainWindow):
         # 打开图像输出目录
         images_info = project_status.get("images_info", {})
         output_dir = images_info.get("output_directory")
-        if output_dir and os.path.exists(output_dir):
-            os.startfile(output_dir)
+        if output_dir and QDir(output_dir).exists():
+            # 交给平台服务打开目录，跨平台且不阻塞GUI线程
+            QDesktopServices.openUrl(QUrl.fromLocalFile(output_dir))
     
     def create_video(self):
         """创建视频"""
@@ -1488,20 +1996,6 @@ class NewMainWindow(QMainWindow):
             QMessageBox.warning(self, "警告", "请先生成分镜和图像")
             return
         
-        def on_video_finished(result):
-            self.video_info_label.setText(f"视频已生成: {result}")
-            self.hide_progress()
-            self.update_project_status()
-            self.status_label.setText("视频创建完成")
-            QMessageBox.information(self, "创建完成", f"视频已创建:\n{result}")
-        
-        def on_video_error(error):
-            self.hide_progress()
-            QMessageBox.critical(self, "创建失败", f"视频创建失败:\n{error}")
-        
-        def on_progress(progress, message):
-            self.show_progress(progress, message)
-        
         config = VideoConfig(
             fps=self.fps_spin.value(),
             duration_per_shot=self.duration_spin.value(),
@@ -1510,13 +2004,19 @@ class NewMainWindow(QMainWindow):
             background_music_volume=self.music_volume_slider.value() / 100.0
         )
         
-        self.current_worker = AsyncWorker(
+        self._launch_worker(
             self.app_controller.create_video_only,
-            None, None, config, on_progress
+            (None, None, config, self.show_progress),
+            self._on_video_finished, partial(self._on_worker_error, "video")
         )
-        self.current_worker.signals.finished.connect(on_video_finished)
-        self.current_worker.signals.error.connect(on_video_error)
-        self.current_worker.start()
+    
+    def _on_video_finished(self, result):
+        """视频创建完成"""
+        self.video_info_label.setText(f"视频已生成: {result}")
+        self.hide_progress()
+        self._schedule_status_update()
+        self.status_label.setText("视频创建完成")
+        QMessageBox.information(self, "创建完成", f"视频已创建:\n{result}")
     
     def create_animated_video(self):
         """创建动画视频"""
@@ -1525,31 +2025,23 @@ class NewMainWindow(QMainWindow):
             QMessageBox.warning(self, "警告", "请先生成图像")
             return
         
-        def on_animated_finished(result):
-            self.video_info_label.setText(f"动画视频已生成: {result}")
-            self.hide_progress()
-            self.status_label.setText("动画视频创建完成")
-            QMessageBox.information(self, "创建完成", f"动画视频已创建:\n{result}")
-        
-        def on_animated_error(error):
-            self.hide_progress()
-            QMessageBox.critical(self, "创建失败", f"动画视频创建失败:\n{error}")
-        
-        def on_progress(progress, message):
-            self.show_progress(progress, message)
-        
         config = VideoConfig(
             fps=self.fps_spin.value(),
             duration_per_shot=self.duration_spin.value()
         )
         
-        self.current_worker = AsyncWorker(
+        self._launch_worker(
             self.app_controller.create_animated_video,
-            None, "ken_burns", config, on_progress
+            (None, "ken_burns", config, self.show_progress),
+            self._on_animated_finished, partial(self._on_worker_error, "animated")
         )
-        self.current_worker.signals.finished.connect(on_animated_finished)
-        self.current_worker.signals.error.connect(on_animated_error)
-        self.current_worker.start()
+    
+    def _on_animated_finished(self, result):
+        """动画视频创建完成"""
+        self.video_info_label.setText(f"动画视频已生成: {result}")
+        self.hide_progress()
+        self.status_label.setText("动画视频创建完成")
+        QMessageBox.information(self, "创建完成", f"动画视频已创建:\n{result}")
     
     def add_subtitles(self):
         """添加字幕"""
@@ -1558,35 +2050,59 @@ class NewMainWindow(QMainWindow):
             QMessageBox.warning(self, "警告", "请先生成视频和分镜")
             return
         
-        def on_subtitles_finished(result):
-            self.video_info_label.setText(f"带字幕视频已生成: {result}")
-            self.hide_progress()
-            self.status_label.setText("字幕添加完成")
-            QMessageBox.information(self, "添加完成", f"带字幕视频已生成:\n{result}")
-        
-        def on_subtitles_error(error):
-            self.hide_progress()
-            QMessageBox.critical(self, "添加失败", f"字幕添加失败:\n{error}")
-        
-        self.current_worker = AsyncWorker(self.app_controller.add_subtitles)
-        self.current_worker.signals.finished.connect(on_subtitles_finished)
-        self.current_worker.signals.error.connect(on_subtitles_error)
-        self.current_worker.start()
+        self._launch_worker(
+            self.app_controller.add_subtitles, (),
+            self._on_subtitles_finished, partial(self._on_worker_error, "subtitles")
+        )
         
         self.show_progress(0.5, "正在添加字幕...")
     
+    def _on_subtitles_finished(self, result):
+        """字幕添加完成"""
+        self.video_info_label.setText(f"带字幕视频已生成: {result}")
+        self.hide_progress()
+        self.status_label.setText("字幕添加完成")
+        QMessageBox.information(self, "添加完成", f"带字幕视频已生成:\n{result}")
+    
     def browse_music_file(self):
         """浏览音乐文件"""
-        file_path, _ = QFileDialog.getOpenFileName(self, "选择音乐文件", "", "音频文件 (*.mp3 *.wav *.m4a *.aac)")
+        file_path = self._exec_file_dialog("music", "选择音乐文件", QFileDialog.ExistingFile, "音频文件 (*.mp3 *.wav *.m4a *.aac)")
         if file_path:
             self.music_path_edit.setText(file_path)
     
     def browse_output_dir(self):
         """浏览输出目录"""
-        dir_path = QFileDialog.getExistingDirectory(self, "选择输出目录")
+        dir_path = self._exec_file_dialog("output_dir", "选择输出目录", QFileDialog.Directory)
         if dir_path:
             self.output_dir_edit.setText(dir_path)
     
+    def _get_new_project_dialog(self, title: str) -> NewProjectDialog:
+        """获取清空后的新建项目对话框，首次使用时创建"""
+        if self._new_project_dialog is None:
+            self._new_project_dialog = NewProjectDialog(self)
+        dialog = self._new_project_dialog
+        dialog.reset_fields()
+        dialog.setWindowTitle(title)
+        return dialog
+    
+    def _exec_file_dialog(self, key: str, title: str, file_mode, name_filter: str = None) -> str:
+        """显示可复用的文件对话框，返回所选路径（取消时返回空字符串）"""
+        dialog = self._file_dialogs.get(key)
+        if dialog is None:
+            dialog = QFileDialog(self, title)
+            dialog.setFileMode(file_mode)
+            if file_mode == QFileDialog.Directory:
+                dialog.setOption(QFileDialog.ShowDirsOnly, True)
+            if name_filter:
+                dialog.setNameFilter(name_filter)
+            self._file_dialogs[key] = dialog
+        
+        if dialog.exec_() == QDialog.Accepted:
+            selected = dialog.selectedFiles()
+            if selected:
+                return selected[0]
+        return ""
+    
     def clear_project(self):
         """清空项目"""
         reply = QMessageBox.question(self, "清空项目", "确定要清空当前项目吗？")
@@ -1618,6 +2134,8 @@ class NewMainWindow(QMainWindow):
         file_path, _ = QFileDialog.getOpenFileName(self, "导入项目", "", "JSON文件 (*.json)")
         if file_path:
             try:
+                # 先完成当前项目的后台保存，再切换项目
+                self._wait_for_saves()
                 # 使用project_manager的导入方法
                 success = self.project_manager.import_project(file_path)
                 if success:
@@ -1626,7 +2144,7 @@ class NewMainWindow(QMainWindow):
                     QMessageBox.information(self, "导入成功", f"项目已成功导入:\n{file_path}")
                     
                     # 刷新项目状态和界面
-                    self.update_project_status()
+                    self._schedule_status_update()
                     
                     # 如果有五阶段标签页，尝试加载数据
                     if hasattr(self, 'five_stage_tab'):
@@ -1650,84 +2168,85 @@ class NewMainWindow(QMainWindow):
         """配置API"""
         QMessageBox.information(self, "配置API", "API配置功能正在开发中...")
     
+    def _schedule_status_update(self):
+        """请求刷新项目状态，50ms内的多次请求合并为一次"""
+        self._status_timer.start()
+    
+    def _set_status_text(self, text: str):
+        """设置项目状态文本，内容未变化时跳过"""
+        if text != self._last_status_text:
+            self.project_status_label.setText(text)
+            self._last_status_text = text
+    
+    def _set_info_text(self, text: str):
+        """设置项目信息文本，内容未变化时跳过"""
+        if text != self._last_info_text:
+            self.project_info_text.setPlainText(text)
+            self._last_info_text = text
+    
     def update_project_status(self):
         """更新项目状态"""
         try:
             # 获取项目管理器状态
             project_status = self.project_manager.get_project_status()
             
+            if project_status == self._last_rendered_status:
+                return
+            self._last_rendered_status = project_status
+            
             if project_status["has_project"]:
                 # 有项目时显示项目状态
-                status_text = f"项目: {project_status['project_name']}\n"
-                status_text += f"目录: {project_status['project_dir']}\n\n"
-                status_text += "文件状态:\n"
-                
                 files_status = project_status["files_status"]
-                status_names = {
-                    "original_text": "原始文本",
-                    "rewritten_text": "改写文本",
-                    "storyboard": "分镜脚本",
-                    "images": "生成图片",
-                    "audio": "音频文件",
-                    "video": "视频文件",
-                    "final_video": "最终视频",
-                    "subtitles": "字幕文件"
-                }
+                parts = [
+                    f"项目: {project_status['project_name']}\n",
+                    f"目录: {project_status['project_dir']}\n\n",
+                    "文件状态:\n",
+                ]
                 
                 for file_type, status in files_status.items():
-                    name = status_names.get(file_type, file_type)
+                    name = _FILE_STATUS_NAMES.get(file_type, file_type)
                     if file_type == "images":
-                        exists = status.get("exists", False)
-                        count = status.get("count", 0)
-                        status_icon = "✅" if exists else "❌"
-                        status_text += f"{status_icon} {name}: {count} 张\n"
+                        status_icon = _STATUS_ICONS[bool(status.get("exists", False))]
+                        parts.append(f"{status_icon} {name}: {status.get('count', 0)} 张\n")
                     elif file_type == "storyboard" and "stage_status" in status:
                         # 五阶段分镜脚本的特殊显示
                         current_stage = status.get("current_stage", 1)
                         stage_status = status.get("stage_status", {})
                         
-                        status_text += f"📝 {name} (阶段 {current_stage}/5):\n"
-                        stage_names = {
-                            "stage_1": "  └ 世界观圣经",
-                            "stage_2": "  └ 角色管理", 
-                            "stage_3": "  └ 场景分割",
-                            "stage_4": "  └ 分镜脚本",  # 第4阶段：分镜脚本生成
-                            "stage_5": "  └ 优化预览"
-                        }
-                        
-                        for stage_key, stage_name in stage_names.items():
-                            stage_done = stage_status.get(stage_key, False)
-                            stage_icon = "✅" if stage_done else "❌"
-                            status_text += f"{stage_icon} {stage_name}\n"
+                        parts.append(f"📝 {name} (阶段 {current_stage}/5):\n")
+                        for stage_key, stage_lines in _STORYBOARD_STAGE_LINES:
+                            parts.append(stage_lines[bool(stage_status.get(stage_key, False))])
                     else:
-                        exists = status.get("exists", False)
-                        status_icon = "✅" if exists else "❌"
-                        status_text += f"{status_icon} {name}\n"
+                        exists = bool(status.get("exists", False))
+                        lines = _FILE_STATUS_LINES.get(file_type)
+                        parts.append(lines[exists] if lines else f"{_STATUS_ICONS[exists]} {name}\n")
                 
-                self.project_status_label.setText(status_text)
+                self._set_status_text("".join(parts))
                 
                 # 更新项目信息
-                info_text = f"创建时间: {project_status['created_time'][:19].replace('T', ' ')}\n"
-                info_text += f"修改时间: {project_status['last_modified'][:19].replace('T', ' ')}\n\n"
-                
-                # 添加文件路径信息
-                info_text += "文件路径:\n"
+                info_parts = [
+                    f"创建时间: {project_status['created_time'][:19].replace('T', ' ')}\n",
+                    f"修改时间: {project_status['last_modified'][:19].replace('T', ' ')}\n\n",
+                    # 添加文件路径信息
+                    "文件路径:\n",
+                ]
                 for file_type, status in files_status.items():
                     if file_type != "images" and status.get("path"):
-                        name = status_names.get(file_type, file_type)
-                        info_text += f"• {name}: {status['path']}\n"
+                        name = _FILE_STATUS_NAMES.get(file_type, file_type)
+                        info_parts.append(f"• {name}: {status['path']}\n")
                 
-                self.project_info_text.setPlainText(info_text)
+                self._set_info_text("".join(info_parts))
                 
             else:
                 # 没有项目时显示默认状态
-                self.project_status_label.setText("项目状态: 无项目\n\n请创建或打开一个项目")
-                self.project_info_text.setPlainText("暂无项目信息")
+                self._set_status_text("项目状态: 无项目\n\n请创建或打开一个项目")
+                self._set_info_text("暂无项目信息")
             
         except Exception as e:
             logger.error(f"更新项目状态失败: {e}")
-            self.project_status_label.setText("项目状态: 获取状态失败")
-            self.project_info_text.setPlainText(f"错误: {e}")
+            self._last_rendered_status = None
+            self._set_status_text("项目状态: 获取状态失败")
+            self._set_info_text(f"错误: {e}")
     
     def init_theme_system(self):
         """初始化主题系统"""
@@ -1757,16 +2276,9 @@ class NewMainWindow(QMainWindow):
                 # 获取完整样式表
                 stylesheet = style_manager.get_complete_stylesheet()
                 
-                # 应用到主窗口
+                # 应用到主窗口，Qt会自动将样式传播并重绘子控件
                 self.setStyleSheet(stylesheet)
                 
-                # 强制更新所有子控件
-                self.update()
-                
-                # 递归更新所有子控件
-                for widget in self.findChildren(QWidget):
-                    widget.update()
-                    
                 logger.info("主题样式已刷新")
         except Exception as e:
             logger.error(f"刷新主题样式失败: {e}")
@@ -1816,14 +2328,23 @@ class NewMainWindow(QMainWindow):
         """窗口关闭事件"""
         reply = QMessageBox.question(self, "退出", "确定要退出应用吗？")
         if reply == QMessageBox.Yes:
+            # 还在防抖等待中的编辑立即保存，再等待后台文本保存写完
+            if self._autosave_timer.isActive():
+                self._autosave_timer.stop()
+                self.auto_save_original_text()
+            self._wait_for_saves()
+            
             # 关闭应用控制器
+            runner = AsyncRunner.instance()
             try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                loop.run_until_complete(self.app_controller.shutdown())
-                loop.close()
+                # 在初始化所用的共享事件循环上关闭，避免为退出单独创建事件循环
+                runner.submit(self.app_controller.shutdown()).result(timeout=_SHUTDOWN_TIMEOUT_S)
+            except concurrent.futures.TimeoutError:
+                logger.warning(f"关闭应用控制器超时（{_SHUTDOWN_TIMEOUT_S}秒），直接退出")
             except Exception as e:
                 logger.error(f"关闭应用控制器失败: {e}")
+            finally:
+                runner.shutdown()
             
             event.accept()
         else:
@@ -1979,8 +2500,9 @@ class NewMainWindow(QMainWindow):
                 if file_type == 'images' and isinstance(file_path, list):
                     # 验证图像文件列表
                     valid_images = []
+                    existing = _existing_paths(file_path)
                     for img_path in file_path:
-                        if Path(img_path).exists():
+                        if str(img_path) in existing:
                             valid_images.append(img_path)
                         else:
                             logger.warning(f"图像文件不存在: {img_path}")
@@ -2052,9 +2574,7 @@ class NewMainWindow(QMainWindow):
                 
                 logger.info("一致性控制面板数据更新完成")
         except Exception as e:
-            logger.error(f"更新一致性控制面板失败: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"更新一致性控制面板失败: {e}")
     
     def _verify_load_completion(self):
         """验证项目加载完成情况"""
@@ -2064,7 +2584,7 @@ class NewMainWindow(QMainWindow):
             
             # 检查各组件加载状态
             load_status = {
-                '文本内容': bool(self.text_input.toPlainText()),
+                '文本内容': not self.text_input.document().isEmpty(),
                 '改写文本': bool(self.rewritten_text.toPlainText()),
                 '图像列表': self.image_list.count() > 0,
                 '五阶段数据': False,
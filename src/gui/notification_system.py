@@ -8,17 +8,30 @@
 import sys
 from PyQt5.QtWidgets import (
     QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, 
-    QGraphicsDropShadowEffect, QApplication, QFrame
+    QApplication, QFrame
 )
 from PyQt5.QtCore import (
     Qt, QTimer, QPropertyAnimation, QEasingCurve, 
-    QRect, pyqtSignal, QPoint
+    QRect, pyqtSignal, pyqtSlot, QPoint, QThread
 )
-from PyQt5.QtGui import QFont, QPalette, QColor, QPainter, QPen
+from PyQt5.QtGui import QFont, QPalette, QColor, QPainter, QPen, QPixmap
 from enum import Enum
-from typing import Optional, List
-import threading
+from typing import Dict, Optional, List, Tuple, Mapping
+from types import MappingProxyType
 import time
+import heapq
+import weakref
+import logging
+
+try:
+    from utils.logger import logger
+except ImportError:
+    logger = logging.getLogger(__name__)
+
+try:
+    from .modern_styles import load_qss_file, register_app_stylesheet
+except ImportError:
+    from modern_styles import load_qss_file, register_app_stylesheet
 
 class NotificationType(Enum):
     """通知类型枚举"""
@@ -28,6 +41,98 @@ class NotificationType(Enum):
     INFO = "info"
     LOADING = "loading"
 
+# 各通知类型的图标（颜色见 assets/components.qss），只读映射
+_NOTIFICATION_ICONS: Mapping[NotificationType, str] = MappingProxyType({
+    NotificationType.SUCCESS: '✓',
+    NotificationType.WARNING: '⚠',
+    NotificationType.ERROR: '✗',
+    NotificationType.INFO: 'ℹ',
+    NotificationType.LOADING: '⟳',
+})
+
+# 共用的字体（需要QApplication，首次使用时创建）
+_fonts: Optional[Tuple[QFont, QFont]] = None
+
+def _get_fonts() -> Tuple[QFont, QFont]:
+    """获取消息字体和图标字体"""
+    global _fonts
+    if _fonts is None:
+        message_font = QFont()
+        message_font.setPointSize(10)
+        
+        icon_font = QFont()
+        icon_font.setPointSize(14)
+        icon_font.setBold(True)
+        
+        _fonts = (message_font, icon_font)
+    return _fonts
+
+# 通知阴影参数
+_SHADOW_RADIUS = 8
+_SHADOW_OFFSET_Y = 4
+_SHADOW_ALPHA = 60
+
+# 按尺寸缓存的阴影图，所有通知共用
+_shadow_cache: Dict[Tuple[int, int], QPixmap] = {}
+
+def _get_shadow_pixmap(width: int, height: int) -> QPixmap:
+    """获取指定内容尺寸的阴影图（首次使用时绘制）"""
+    key = (width, height)
+    pixmap = _shadow_cache.get(key)
+    if pixmap is None:
+        radius = _SHADOW_RADIUS
+        pixmap = QPixmap(width + 2 * radius, height + 2 * radius)
+        pixmap.fill(Qt.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        # 由外向内叠加半透明圆角矩形，近似模糊阴影
+        color = QColor(0, 0, 0, max(1, _SHADOW_ALPHA // radius))
+        painter.setBrush(color)
+        for i in range(radius):
+            rect = pixmap.rect().adjusted(i, i, -i, -i)
+            painter.drawRoundedRect(rect, 8 + radius - i, 8 + radius - i)
+        painter.end()
+        
+        _shadow_cache[key] = pixmap
+    return pixmap
+
+# 自动关闭调度：所有通知共用一个定时器，按截止时间排列在堆中
+_CLOSE_TICK_MS = 100
+_close_heap: List[Tuple[float, int, "weakref.ref"]] = []
+_close_seq = 0
+_close_timer: Optional[QTimer] = None
+
+def _schedule_auto_close(widget: "NotificationWidget", duration_ms: int):
+    """登记通知的自动关闭时间"""
+    global _close_seq, _close_timer
+    _close_seq += 1
+    deadline = time.monotonic() + duration_ms / 1000.0
+    heapq.heappush(_close_heap, (deadline, _close_seq, weakref.ref(widget)))
+    
+    if _close_timer is None:
+        _close_timer = QTimer()
+        _close_timer.setInterval(_CLOSE_TICK_MS)
+        _close_timer.timeout.connect(_close_expired)
+    if not _close_timer.isActive():
+        _close_timer.start()
+
+def _close_expired():
+    """关闭已到期的通知，堆为空时停止定时器"""
+    now = time.monotonic()
+    while _close_heap and _close_heap[0][0] <= now:
+        _, _, ref = heapq.heappop(_close_heap)
+        widget = ref()
+        if widget is not None:
+            try:
+                widget.start_close_animation()
+            except RuntimeError:
+                # 底层Qt对象已销毁
+                pass
+    if not _close_heap:
+        _close_timer.stop()
+
 class NotificationWidget(QWidget):
     """单个通知组件"""
     
@@ -41,15 +146,15 @@ class NotificationWidget(QWidget):
         self.notification_type = notification_type
         self.duration = duration
         self.is_closing = False
+        # 管理器上次分配的目标位置(x, y)
+        self._last_target: Optional[Tuple[int, int]] = None
         
         self.init_ui()
         self.setup_animation()
         
-        # 自动关闭定时器
+        # 自动关闭（由共享定时器调度）
         if duration > 0:
-            self.auto_close_timer = QTimer()
-            self.auto_close_timer.timeout.connect(self.start_close_animation)
-            self.auto_close_timer.start(duration)
+            _schedule_auto_close(self, duration)
     
     def init_ui(self):
         """初始化界面"""
@@ -67,11 +172,16 @@ class NotificationWidget(QWidget):
         
         # 主布局
         main_layout = QVBoxLayout()
-        main_layout.setContentsMargins(12, 8, 12, 8)
+        # 边距需容纳阴影：底部阴影延伸 半径+下移偏移，左右和顶部不超过半径
+        main_layout.setContentsMargins(
+            max(12, _SHADOW_RADIUS), max(8, _SHADOW_RADIUS - _SHADOW_OFFSET_Y),
+            max(12, _SHADOW_RADIUS), max(8, _SHADOW_RADIUS + _SHADOW_OFFSET_Y)
+        )
         
         # 内容框架
         content_frame = QFrame()
         content_frame.setObjectName("notification_frame")
+        self.content_frame = content_frame
         content_layout = QHBoxLayout(content_frame)
         content_layout.setContentsMargins(16, 12, 16, 12)
         
@@ -99,155 +209,108 @@ class NotificationWidget(QWidget):
         
         # 设置样式
         self.apply_style()
-        
-        # 添加阴影效果
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setColor(QColor(0, 0, 0, 60))
-        shadow.setOffset(0, 4)
-        content_frame.setGraphicsEffect(shadow)
+    
+    def paintEvent(self, event):
+        """绘制阴影：使用缓存的阴影图，避免图形效果在每次重绘时离屏渲染和模糊"""
+        frame_rect = self.content_frame.geometry()
+        shadow = _get_shadow_pixmap(frame_rect.width(), frame_rect.height())
+        painter = QPainter(self)
+        painter.drawPixmap(
+            frame_rect.x() - _SHADOW_RADIUS,
+            frame_rect.y() - _SHADOW_RADIUS + _SHADOW_OFFSET_Y,
+            shadow
+        )
+        painter.end()
     
     def apply_style(self):
         """应用样式"""
-        # 根据通知类型设置不同的颜色和图标
-        colors = {
-            NotificationType.SUCCESS: {
-                'bg': '#d4edda', 'border': '#28a745', 'text': '#155724',
-                'icon': '✓', 'btn_hover': '#c3e5cb'
-            },
-            NotificationType.WARNING: {
-                'bg': '#fff3cd', 'border': '#ffc107', 'text': '#856404',
-                'icon': '⚠', 'btn_hover': '#ffeaa3'
-            },
-            NotificationType.ERROR: {
-                'bg': '#f8d7da', 'border': '#dc3545', 'text': '#721c24',
-                'icon': '✗', 'btn_hover': '#f1b6bb'
-            },
-            NotificationType.INFO: {
-                'bg': '#d1ecf1', 'border': '#17a2b8', 'text': '#0c5460',
-                'icon': 'ℹ', 'btn_hover': '#bee5eb'
-            },
-            NotificationType.LOADING: {
-                'bg': '#e2e3e5', 'border': '#6c757d', 'text': '#383d41',
-                'icon': '⟳', 'btn_hover': '#d1d2d3'
-            }
-        }
-        
-        style_config = colors[self.notification_type]
-        
         # 设置图标
-        self.icon_label.setText(style_config['icon'])
+        self.icon_label.setText(_NOTIFICATION_ICONS[self.notification_type])
         
-        # 应用样式表
-        self.setStyleSheet(f"""
-            #notification_frame {{
-                background-color: {style_config['bg']};
-                border: 2px solid {style_config['border']};
-                border-radius: 8px;
-                color: {style_config['text']};
-            }}
-            
-            QLabel {{
-                color: {style_config['text']};
-                font-size: 14px;
-                background: transparent;
-            }}
-            
-            #close_btn {{
-                background-color: transparent;
-                border: none;
-                color: {style_config['text']};
-                font-size: 16px;
-                font-weight: bold;
-                border-radius: 10px;
-            }}
-            
-            #close_btn:hover {{
-                background-color: {style_config['btn_hover']};
-            }}
-        """)
-        
-        # 设置字体
-        font = QFont()
-        font.setPointSize(10)
-        self.message_label.setFont(font)
+        # 样式由应用级样式表按notifType属性选择，不再为每个通知解析样式表
+        self.content_frame.setProperty("notifType", self.notification_type.value)
         
-        icon_font = QFont()
-        icon_font.setPointSize(14)
-        icon_font.setBold(True)
+        # 设置字体（所有通知共用同一组字体对象）
+        message_font, icon_font = _get_fonts()
+        self.message_label.setFont(message_font)
         self.icon_label.setFont(icon_font)
     
     def setup_animation(self):
-        """设置动画"""
-        # 滑入动画
-        self.slide_in_animation = QPropertyAnimation(self, b"pos")
-        self.slide_in_animation.setDuration(300)
-        self.slide_in_animation.setEasingCurve(QEasingCurve.OutCubic)
+        """设置动画（滑入和移动共用位置动画，关闭使用透明度渐隐）"""
+        self.pos_animation = QPropertyAnimation(self, b"pos")
+        self.pos_animation.setDuration(300)
+        self.pos_animation.setEasingCurve(QEasingCurve.OutCubic)
         
-        # 滑出动画
-        self.slide_out_animation = QPropertyAnimation(self, b"pos")
-        self.slide_out_animation.setDuration(250)
-        self.slide_out_animation.setEasingCurve(QEasingCurve.InCubic)
-        self.slide_out_animation.finished.connect(self.close)
+        # 渐隐不移动顶层窗口，避免每帧的窗口移动调用
+        self.fade_out = QPropertyAnimation(self, b"windowOpacity")
+        self.fade_out.setDuration(200)
+        self.fade_out.setStartValue(1.0)
+        self.fade_out.setEndValue(0.0)
+        self.fade_out.finished.connect(self.close)
+    
+    def move_animated(self, end_pos: QPoint):
+        """以滑入动画移动到指定位置，已在目标位置时不启动动画"""
+        if self.is_closing:
+            return
+        animation = self.pos_animation
+        if animation.state() == QPropertyAnimation.Running:
+            if animation.endValue() == end_pos:
+                return
+        elif self.pos() == end_pos:
+            return
+        animation.stop()
+        animation.setStartValue(self.pos())
+        animation.setEndValue(end_pos)
+        animation.start()
     
     def show_animation(self, start_pos: QPoint, end_pos: QPoint):
         """显示动画"""
         self.move(start_pos)
         self.show()
-        
-        self.slide_in_animation.setStartValue(start_pos)
-        self.slide_in_animation.setEndValue(end_pos)
-        self.slide_in_animation.start()
+        self.move_animated(end_pos)
     
     def start_close_animation(self):
         """开始关闭动画"""
         if self.is_closing:
             return
             
+        # 已登记的自动关闭到期时会因is_closing直接返回
         self.is_closing = True
         
-        # 停止自动关闭定时器
-        if hasattr(self, 'auto_close_timer'):
-            self.auto_close_timer.stop()
-        
-        # 滑出动画
-        current_pos = self.pos()
-        end_pos = QPoint(current_pos.x() + 400, current_pos.y())
-        
-        self.slide_out_animation.setStartValue(current_pos)
-        self.slide_out_animation.setEndValue(end_pos)
-        self.slide_out_animation.start()
+        # 渐隐动画，结束后关闭
+        self.pos_animation.stop()
+        self.fade_out.start()
         
         # 发送关闭信号
         self.closeRequested.emit()
 
 class NotificationManager(QWidget):
-    """通知管理器"""
-    
-    _instance = None
-    _lock = threading.Lock()
-    
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-        return cls._instance
+    """通知管理器（通过get_notification_manager()获取全局实例）"""
     
     def __init__(self):
-        # 先调用父类初始化
         super().__init__()
         
-        # 检查是否已经初始化（防止单例重复初始化）
-        if hasattr(self, '_initialized'):
-            return
-            
-        self._initialized = True
+        # 通知样式加入应用级样式表，只解析一次
+        register_app_stylesheet(load_qss_file("components.qss"))
+        
         self.notifications: List[NotificationWidget] = []
         self.max_notifications = 5
         self.spacing = 10
         self.margin = 20
         
+        # 重新定位合并定时器：同一次事件循环内的多次请求只定位一次
+        self._reposition_pending = False
+        self._reposition_timer = QTimer(self)
+        self._reposition_timer.setSingleShot(True)
+        self._reposition_timer.setInterval(0)
+        self._reposition_timer.timeout.connect(self._do_position_notifications)
+        
+        # 缓存主屏幕区域，屏幕变化时才重新获取
+        self._screen_rect: Optional[QRect] = None
+        app = QApplication.instance()
+        app.primaryScreenChanged.connect(self._on_primary_screen_changed)
+        self._watch_screen(app.primaryScreen())
+        
         # 隐藏管理器窗口
         self.hide()
     
@@ -257,7 +320,7 @@ class NotificationManager(QWidget):
         try:
             # 创建通知组件
             notification = NotificationWidget(message, notification_type, duration, parent)
-            notification.closeRequested.connect(lambda: self.remove_notification(notification))
+            notification.closeRequested.connect(self._on_close_requested)
             
             # 添加到列表
             self.notifications.append(notification)
@@ -268,7 +331,7 @@ class NotificationManager(QWidget):
                 old_notification.start_close_animation()
             
             # 计算位置并显示
-            self.position_notifications()
+            self._request_reposition()
             
             return notification
             
@@ -276,14 +339,48 @@ class NotificationManager(QWidget):
             print(f"显示通知失败: {e}")
             return None
     
+    def _watch_screen(self, screen):
+        """监听主屏幕尺寸变化"""
+        if screen is not None:
+            screen.geometryChanged.connect(self._invalidate_screen_rect)
+    
+    def _on_primary_screen_changed(self, screen):
+        """主屏幕切换"""
+        self._watch_screen(screen)
+        self._invalidate_screen_rect()
+    
+    def _invalidate_screen_rect(self, *args):
+        """屏幕区域失效，下次定位时重新获取"""
+        self._screen_rect = None
+    
+    def _get_screen_rect(self) -> QRect:
+        """获取主屏幕区域"""
+        if self._screen_rect is None:
+            screen = QApplication.primaryScreen()
+            self._screen_rect = screen.geometry() if screen is not None else QRect(0, 0, 1920, 1080)
+        return self._screen_rect
+    
+    def _request_reposition(self):
+        """请求重新定位通知，合并到下一次事件循环执行"""
+        if self._reposition_pending:
+            return
+        self._reposition_pending = True
+        self._reposition_timer.start()
+    
     def position_notifications(self):
         """重新定位所有通知"""
+        self._reposition_timer.stop()
+        self._do_position_notifications()
+    
+    def _do_position_notifications(self):
+        """重新定位所有通知（实际执行）"""
+        self._reposition_pending = False
         if not self.notifications:
             return
         
         try:
             # 获取屏幕尺寸
-            screen = QApplication.desktop().screenGeometry()
+            screen = self._get_screen_rect()
             
             # 确保通知不会超出屏幕边界
             notification_width = 350
@@ -304,15 +401,19 @@ class NotificationManager(QWidget):
                         old_notification.start_close_animation()
                     break
                 
+                # 目标位置与上次相同（稳定状态）时直接跳过，不构造QPoint
+                target = (start_x, target_y)
+                if notification._last_target == target:
+                    continue
+                notification._last_target = target
+                
                 start_pos = QPoint(screen.width(), target_y)  # 从右侧滑入
                 end_pos = QPoint(start_x, target_y)
                 
                 # 如果通知已经显示，只需要调整位置
                 if notification.isVisible():
-                    # 使用动画移动到新位置
-                    notification.slide_in_animation.setStartValue(notification.pos())
-                    notification.slide_in_animation.setEndValue(end_pos)
-                    notification.slide_in_animation.start()
+                    # 使用动画移动到新位置（位置未变化时跳过）
+                    notification.move_animated(end_pos)
                 else:
                     # 新通知，使用滑入动画
                     notification.show_animation(start_pos, end_pos)
@@ -320,12 +421,19 @@ class NotificationManager(QWidget):
         except Exception as e:
             print(f"定位通知失败: {e}")
     
+    @pyqtSlot()
+    def _on_close_requested(self):
+        """通知请求关闭，通过sender()取得发出信号的通知"""
+        notification = self.sender()
+        if notification is not None:
+            self.remove_notification(notification)
+    
     def remove_notification(self, notification: NotificationWidget):
         """移除通知"""
         try:
             if notification in self.notifications:
                 self.notifications.remove(notification)
-                self.position_notifications()  # 重新定位剩余通知
+                self._request_reposition()  # 重新定位剩余通知
         except Exception as e:
             print(f"移除通知失败: {e}")
     
@@ -351,57 +459,54 @@ def get_notification_manager():
             if app is None:
                 print("警告：没有QApplication实例，通知系统将不可用")
                 return None
+            # 通知组件只能在GUI线程创建（不使用assert，python -O下也要生效）
+            if QThread.currentThread() is not app.thread():
+                logger.error("通知管理器必须在GUI线程中创建")
+                return None
             _notification_manager = NotificationManager()
         except Exception as e:
             print(f"创建通知管理器失败: {e}")
             return None
     return _notification_manager
 
+# 通知管理器不可用时改为写日志：通知类型 -> (日志级别, 前缀)
+_FALLBACK_LOG = {
+    NotificationType.SUCCESS: (logging.INFO, "成功"),
+    NotificationType.WARNING: (logging.WARNING, "警告"),
+    NotificationType.ERROR: (logging.ERROR, "错误"),
+    NotificationType.INFO: (logging.INFO, "信息"),
+    NotificationType.LOADING: (logging.INFO, "加载"),
+}
+
+def _show(notification_type: NotificationType, message: str, duration: int):
+    """显示通知，通知管理器不可用时写入日志"""
+    manager = get_notification_manager()
+    if manager:
+        return manager.show_notification(message, notification_type, duration)
+    level, prefix = _FALLBACK_LOG[notification_type]
+    logger.log(level, f"{prefix}: {message}")
+    return None
+
 # 便捷函数
 def show_success(message: str, duration: int = 3000):
     """显示成功通知"""
-    manager = get_notification_manager()
-    if manager:
-        return manager.show_notification(message, NotificationType.SUCCESS, duration)
-    else:
-        print(f"成功: {message}")
-        return None
+    return _show(NotificationType.SUCCESS, message, duration)
 
 def show_warning(message: str, duration: int = 4000):
     """显示警告通知"""
-    manager = get_notification_manager()
-    if manager:
-        return manager.show_notification(message, NotificationType.WARNING, duration)
-    else:
-        print(f"警告: {message}")
-        return None
+    return _show(NotificationType.WARNING, message, duration)
 
 def show_error(message: str, duration: int = 5000):
     """显示错误通知"""
-    manager = get_notification_manager()
-    if manager:
-        return manager.show_notification(message, NotificationType.ERROR, duration)
-    else:
-        print(f"错误: {message}")
-        return None
+    return _show(NotificationType.ERROR, message, duration)
 
 def show_info(message: str, duration: int = 3000):
     """显示信息通知"""
-    manager = get_notification_manager()
-    if manager:
-        return manager.show_notification(message, NotificationType.INFO, duration)
-    else:
-        print(f"信息: {message}")
-        return None
+    return _show(NotificationType.INFO, message, duration)
 
 def show_loading(message: str, duration: int = 0):
     """显示加载通知（不自动关闭）"""
-    manager = get_notification_manager()
-    if manager:
-        return manager.show_notification(message, NotificationType.LOADING, duration)
-    else:
-        print(f"加载: {message}")
-        return None
+    return _show(NotificationType.LOADING, message, duration)
 
 def clear_all():
     """清除所有通知"""
@@ -1,17 +1,36 @@
-from PyQt5.QtCore import QThread, pyqtSignal
+import threading
+
+from PyQt5.QtCore import QThread, QObject, QRunnable, pyqtSignal
 from utils.logger import logger
 from models.pollinations_client import PollinationsClient
 
-class PollinationsGenerationThread(QThread):
-    """Pollinations图像生成线程"""
-    
-    # 信号定义
+# 所有生成线程共用的Pollinations客户端，复用其requests.Session的连接池
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+def _get_shared_pollinations_client() -> PollinationsClient:
+    """获取共享的Pollinations客户端（首次使用时在工作线程中创建）"""
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = PollinationsClient()
+    return _shared_client
+
+class PollinationsGenerationSignals(QObject):
+    """Pollinations图像生成信号"""
     image_generated = pyqtSignal(list)  # 生成成功信号，传递图片路径列表
     error_occurred = pyqtSignal(str)  # 生成失败信号，传递错误信息
     progress_updated = pyqtSignal(str)  # 进度更新信号
+
+class PollinationsGenerationRunnable(QRunnable):
+    """Pollinations图像生成任务，提交到QThreadPool执行以复用线程
+    
+    用法：QThreadPool.globalInstance().start(runnable)，结果通过runnable.signals回传
+    """
     
     def __init__(self, prompt, parameters, project_manager=None, current_project_name=None):
-        """初始化Pollinations生成线程
+        """初始化Pollinations生成任务
         
         Args:
             prompt: 图像描述提示词
@@ -20,63 +39,61 @@ class PollinationsGenerationThread(QThread):
             current_project_name: 当前项目名称
         """
         super().__init__()
+        self.signals = PollinationsGenerationSignals()
         self.prompt = prompt
         self.parameters = parameters or {}
         self.project_manager = project_manager
         self.current_project_name = current_project_name
-        self._is_cancelled = False
+        self._cancel_event = threading.Event()
         
-        # 初始化Pollinations客户端
-        self.pollinations_client = PollinationsClient()
+        # Pollinations客户端在run()中获取，不在GUI线程创建
+        self.pollinations_client = None
         
-        logger.info(f"PollinationsGenerationThread初始化完成")
+        logger.info(f"PollinationsGenerationRunnable初始化完成")
         logger.info(f"提示词: {prompt}")
         logger.info(f"参数: {parameters}")
     
     def cancel(self):
         """取消图像生成"""
-        self._is_cancelled = True
+        self._cancel_event.set()
         logger.info("Pollinations图像生成已被取消")
     
     def run(self):
-        """线程主执行方法"""
+        """任务主执行方法"""
         logger.info("=== Pollinations图像生成线程开始执行 ===")
         
         try:
-            # 检查是否已取消
-            if self._is_cancelled:
+            # 检查是否已取消（任务可能在排队期间被取消）
+            if self._cancel_event.is_set():
                 logger.info("Pollinations图像生成已取消")
-                self.error_occurred.emit("图像生成已取消")
+                self.signals.error_occurred.emit("图像生成已取消")
                 return
             
             # 发送进度更新
-            self.progress_updated.emit("正在使用Pollinations AI生成图像...")
-            
-            # 检查是否已取消
-            if self._is_cancelled:
-                logger.info("Pollinations图像生成已取消")
-                self.error_occurred.emit("图像生成已取消")
-                return
+            self.signals.progress_updated.emit("正在使用Pollinations AI生成图像...")
             
             # 调用Pollinations客户端生成图像
             logger.info("开始调用Pollinations客户端")
+            self.pollinations_client = _get_shared_pollinations_client()
 
-            # 将 project_manager 和 current_project_name 添加到参数字典中
-            current_params = self.parameters.copy()
+            # project_manager、current_project_name和取消事件作为额外参数传入，不复制参数字典
+            extra_params = {'cancel_event': self._cancel_event}
             if self.project_manager:
-                current_params['project_manager'] = self.project_manager
+                extra_params['project_manager'] = self.project_manager
             if self.current_project_name:
-                current_params['current_project_name'] = self.current_project_name
+                extra_params['current_project_name'] = self.current_project_name
 
+            # 界面参数只包含API参数，不会与额外参数重名
             result = self.pollinations_client.generate_image(
                 prompt=self.prompt,
-                **current_params
+                **self.parameters,
+                **extra_params
             )
             
             # 检查是否已取消
-            if self._is_cancelled:
+            if self._cancel_event.is_set():
                 logger.info("Pollinations图像生成已取消")
-                self.error_occurred.emit("图像生成已取消")
+                self.signals.error_occurred.emit("图像生成已取消")
                 return
             
             # 处理结果
@@ -84,21 +101,47 @@ class PollinationsGenerationThread(QThread):
                 if len(result) > 0 and not str(result[0]).startswith("ERROR"):
                     logger.info(f"Pollinations图像生成成功，共 {len(result)} 张图片")
                     logger.info(f"生成的图片路径: {result}")
-                    self.image_generated.emit(result)
+                    self.signals.image_generated.emit(result)
                 else:
                     error_msg = str(result[0]) if result else "未知错误"
                     logger.error(f"Pollinations图像生成失败: {error_msg}")
-                    self.error_occurred.emit(error_msg)
+                    self.signals.error_occurred.emit(error_msg)
             else:
                 error_msg = "Pollinations返回无效结果"
                 logger.error(error_msg)
-                self.error_occurred.emit(error_msg)
+                self.signals.error_occurred.emit(error_msg)
                 
         except Exception as e:
             error_msg = f"Pollinations图像生成过程中发生异常: {str(e)}"
             logger.error(error_msg)
             logger.error(f"异常类型: {type(e).__name__}")
-            self.error_occurred.emit(error_msg)
+            self.signals.error_occurred.emit(error_msg)
         
         finally:
-            logger.info("=== Pollinations图像生成线程执行完成 ===")
\ No newline at end of file
+            logger.info("=== Pollinations图像生成线程执行完成 ===")
+
+class PollinationsGenerationThread(QThread):
+    """Pollinations图像生成线程（兼容旧接口，实际执行逻辑在PollinationsGenerationRunnable中）"""
+    
+    # 信号定义
+    image_generated = pyqtSignal(list)  # 生成成功信号，传递图片路径列表
+    error_occurred = pyqtSignal(str)  # 生成失败信号，传递错误信息
+    progress_updated = pyqtSignal(str)  # 进度更新信号
+    
+    def __init__(self, prompt, parameters, project_manager=None, current_project_name=None):
+        super().__init__()
+        self._runnable = PollinationsGenerationRunnable(
+            prompt, parameters, project_manager, current_project_name
+        )
+        self._runnable.setAutoDelete(False)
+        self._runnable.signals.image_generated.connect(self.image_generated)
+        self._runnable.signals.error_occurred.connect(self.error_occurred)
+        self._runnable.signals.progress_updated.connect(self.progress_updated)
+    
+    def cancel(self):
+        """取消图像生成"""
+        self._runnable.cancel()
+    
+    def run(self):
+        """线程主执行方法"""
+        self._runnable.run()
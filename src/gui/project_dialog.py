@@ -6,14 +6,20 @@
 """
 
 import os
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
-    QTextEdit, QPushButton, QFormLayout, QGroupBox, QListWidget,
-    QListWidgetItem, QMessageBox, QFileDialog, QCheckBox
+    QTextEdit, QPushButton, QFormLayout, QGroupBox, QListView,
+    QMessageBox, QFileDialog, QCheckBox
 )
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import (
+    Qt, QObject, QRunnable, QThreadPool, pyqtSignal, QAbstractListModel, QModelIndex,
+    QRegularExpression
+)
+from typing import Callable, Dict, List, Optional, Tuple
+from PyQt5.QtGui import QFont, QRegularExpressionValidator
 
 try:
     from utils.logger import logger
@@ -21,6 +27,161 @@ except ImportError:
     import logging
     logger = logging.getLogger(__name__)
 
+try:
+    from core.project_manager import load_json_file
+except ImportError:
+    from src.core.project_manager import load_json_file
+
+try:
+    from .notification_system import show_loading, show_success, show_error
+    from .modern_styles import load_qss_file, register_app_stylesheet
+except ImportError:
+    from notification_system import show_loading, show_success, show_error
+    from modern_styles import load_qss_file, register_app_stylesheet
+
+def _ensure_primary_button_style():
+    """确保应用级样式表包含主按钮样式（QPushButton[primary="true"]）"""
+    register_app_stylesheet(load_qss_file("components.qss"))
+
+# 对话框标题字体，所有对话框共用（需要QApplication，首次使用时创建）
+_title_font: Optional[QFont] = None
+
+def _get_title_font() -> QFont:
+    """获取对话框标题字体"""
+    global _title_font
+    if _title_font is None:
+        _title_font = QFont()
+        _title_font.setPointSize(14)
+        _title_font.setBold(True)
+    return _title_font
+
+@lru_cache(maxsize=4096)
+def _fmt_iso(timestamp: str) -> str:
+    """ISO时间字符串转为显示格式（YYYY-MM-DD HH:MM:SS）"""
+    return timestamp[:19].replace('T', ' ')
+
+def _format_project_item(project: dict) -> str:
+    """项目列表项的显示文本"""
+    return "\n".join((
+        f"📁 {project['name']}",
+        f"   创建时间: {_fmt_iso(project['created_time'])}",
+        f"   修改时间: {_fmt_iso(project['last_modified'])}",
+        f"   路径: {project['path']}",
+    ))
+
+class ProjectListModel(QAbstractListModel):
+    """项目列表模型：显示文本在视图需要时才生成"""
+    
+    def __init__(self, projects, parent=None):
+        super().__init__(parent)
+        self._projects = list(projects)
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._projects)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        project = self._projects[index.row()]
+        if role == Qt.DisplayRole:
+            return _format_project_item(project)
+        if role == Qt.UserRole:
+            return project
+        return None
+    
+    def append_projects(self, projects: List[dict]):
+        """在列表末尾追加一批项目"""
+        if not projects:
+            return
+        start = len(self._projects)
+        self.beginInsertRows(QModelIndex(), start, start + len(projects) - 1)
+        self._projects.extend(projects)
+        self.endInsertRows()
+    
+    def remove_project_path(self, project_path: str):
+        """从列表中移除指定目录的项目"""
+        for row, item in enumerate(self._projects):
+            if item.get('path') == project_path:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._projects[row]
+                self.endRemoveRows()
+                return
+
+# 后台加载项目列表时每批送到界面的项目数量
+_PROJECT_PAGE_SIZE = 50
+
+class _ProjectListSignals(QObject):
+    """加载项目列表任务信号"""
+    page_ready = pyqtSignal(list)  # 一批项目摘要
+    finished = pyqtSignal()
+
+class _ProjectListRunnable(QRunnable):
+    """在线程池中扫描项目目录，按批次把项目摘要送回界面"""
+    
+    def __init__(self, list_projects: Callable[[], List[dict]]):
+        super().__init__()
+        self.list_projects = list_projects
+        self.signals = _ProjectListSignals()
+    
+    def run(self):
+        try:
+            projects = self.list_projects()
+        except Exception as e:
+            logger.error(f"加载项目列表失败: {e}")
+            projects = []
+        for start in range(0, len(projects), _PROJECT_PAGE_SIZE):
+            self.signals.page_ready.emit(projects[start:start + _PROJECT_PAGE_SIZE])
+        self.signals.finished.emit()
+
+# 对话框内预读的项目配置最多保留的数量
+_PREFETCH_CACHE_SIZE = 8
+
+class _ProjectLoadSignals(QObject):
+    """预读项目配置任务信号"""
+    loaded = pyqtSignal(str, int, object)  # 项目目录, project.json的mtime_ns, 项目配置
+
+class _ProjectLoadRunnable(QRunnable):
+    """在线程池中读取project.json，选中项目时提前解析，打开时无需再读盘"""
+    
+    def __init__(self, project_path: str):
+        super().__init__()
+        self.project_path = project_path
+        self.signals = _ProjectLoadSignals()
+    
+    def run(self):
+        project_file = os.path.join(self.project_path, "project.json")
+        try:
+            mtime_ns = os.stat(project_file).st_mtime_ns
+            project_config = load_json_file(project_file)
+        except Exception as e:
+            # 预读失败不影响打开，打开时会重新读取并报告错误
+            logger.warning(f"预读项目配置失败: {project_file}, {e}")
+            return
+        self.signals.loaded.emit(self.project_path, mtime_ns, project_config)
+
+class _RmTreeSignals(QObject):
+    """删除目录任务信号"""
+    finished = pyqtSignal(bool, str)  # 是否成功, 错误信息
+
+class _RmTreeRunnable(QRunnable):
+    """在线程池中删除目录，避免大项目删除时阻塞界面"""
+    
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self.signals = _RmTreeSignals()
+    
+    def run(self):
+        import shutil
+        try:
+            shutil.rmtree(self.path)
+        except Exception as e:
+            self.signals.finished.emit(False, str(e))
+            return
+        self.signals.finished.emit(True, "")
+
 class NewProjectDialog(QDialog):
     """新建项目对话框"""
     
@@ -28,6 +189,7 @@ class NewProjectDialog(QDialog):
         super().__init__(parent)
         self.project_name = ""
         self.project_description = ""
+        _ensure_primary_button_style()
         self.init_ui()
     
     def init_ui(self):
@@ -40,10 +202,7 @@ class NewProjectDialog(QDialog):
         
         # 标题
         title_label = QLabel("创建新的AI视频项目")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
+        title_label.setFont(_get_title_font())
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
         
@@ -54,6 +213,8 @@ class NewProjectDialog(QDialog):
         # 项目名称
         self.name_edit = QLineEdit()
         self.name_edit.setPlaceholderText("请输入项目名称...")
+        # 至少包含一个非空白字符才算有效输入，由验证器在C++层判断
+        self.name_edit.setValidator(QRegularExpressionValidator(QRegularExpression(r"\s*\S.*"), self.name_edit))
         self.name_edit.textChanged.connect(self.validate_input)
         form_layout.addRow("项目名称 *:", self.name_edit)
         
@@ -81,21 +242,7 @@ class NewProjectDialog(QDialog):
         self.create_btn = QPushButton("创建项目")
         self.create_btn.clicked.connect(self.accept)
         self.create_btn.setEnabled(False)
-        self.create_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007ACC;
-                color: white;
-                font-weight: bold;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #005999;
-            }
-            QPushButton:disabled {
-                background-color: #CCCCCC;
-            }
-        """)
+        self.create_btn.setProperty("primary", True)
         button_layout.addWidget(self.create_btn)
         
         layout.addLayout(button_layout)
@@ -104,10 +251,17 @@ class NewProjectDialog(QDialog):
         # 设置焦点
         self.name_edit.setFocus()
     
+    def reset_fields(self):
+        """清空输入内容，以便复用同一个对话框"""
+        self.project_name = ""
+        self.project_description = ""
+        self.name_edit.clear()
+        self.description_edit.clear()
+        self.name_edit.setFocus()
+    
     def validate_input(self):
         """验证输入"""
-        name = self.name_edit.text().strip()
-        self.create_btn.setEnabled(len(name) > 0)
+        self.create_btn.setEnabled(self.name_edit.hasAcceptableInput())
     
     def accept(self):
         """确认创建"""
@@ -130,11 +284,21 @@ class NewProjectDialog(QDialog):
 class OpenProjectDialog(QDialog):
     """打开项目对话框"""
     
-    def __init__(self, project_list, parent=None):
+    def __init__(self, project_list=None, parent=None,
+                 list_projects: Optional[Callable[[], List[dict]]] = None):
+        """project_list为已有的项目列表；传入list_projects时在后台加载项目列表，分批显示"""
         super().__init__(parent)
-        self.project_list = project_list
+        self.project_list = project_list or []
         self.selected_project = None
+        self._deleting_project = None
+        self._delete_notification = None
+        # 预读的项目配置：项目目录 -> (mtime_ns, 配置)，按最近使用排序
+        self._prefetched: "OrderedDict[str, Tuple[int, Dict]]" = OrderedDict()
+        self._prefetching = set()
+        _ensure_primary_button_style()
         self.init_ui()
+        if list_projects is not None:
+            self._load_projects_async(list_projects)
     
     def init_ui(self):
         """初始化界面"""
@@ -145,27 +309,22 @@ class OpenProjectDialog(QDialog):
         layout = QVBoxLayout()
         
         # 标题
-        title_label = QLabel("选择要打开的项目")
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title_label.setFont(title_font)
-        layout.addWidget(title_label)
+        self.title_label = QLabel("选择要打开的项目")
+        self.title_label.setFont(_get_title_font())
+        layout.addWidget(self.title_label)
         
         # 项目列表
-        self.project_list_widget = QListWidget()
-        self.project_list_widget.itemDoubleClicked.connect(self.accept)
-        self.project_list_widget.itemClicked.connect(self.on_item_selected)
-        
-        for project in self.project_list:
-            item = QListWidgetItem()
-            item_text = f"📁 {project['name']}\n"
-            item_text += f"   创建时间: {project['created_time'][:19].replace('T', ' ')}\n"
-            item_text += f"   修改时间: {project['last_modified'][:19].replace('T', ' ')}\n"
-            item_text += f"   路径: {project['path']}"
-            item.setText(item_text)
-            item.setData(Qt.UserRole, project)
-            self.project_list_widget.addItem(item)
+        self.project_model = ProjectListModel(self.project_list, self)
+        self.project_list_widget = QListView()
+        self.project_list_widget.setModel(self.project_model)
+        # 所有项目行高相同，视图无需逐项测量
+        self.project_list_widget.setUniformItemSizes(True)
+        # 分批布局，项目很多时首次显示不会一次性计算全部行
+        self.project_list_widget.setLayoutMode(QListView.Batched)
+        self.project_list_widget.setBatchSize(100)
+        self.project_list_widget.doubleClicked.connect(self.accept)
+        # 鼠标和键盘切换当前项都会触发，按需从模型取项目数据
+        self.project_list_widget.selectionModel().currentChanged.connect(self.on_item_selected)
         
         layout.addWidget(self.project_list_widget)
         
@@ -196,31 +355,60 @@ class OpenProjectDialog(QDialog):
         self.open_btn = QPushButton("打开项目")
         self.open_btn.clicked.connect(self.accept)
         self.open_btn.setEnabled(False)
-        self.open_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #007ACC;
-                color: white;
-                font-weight: bold;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #005999;
-            }
-            QPushButton:disabled {
-                background-color: #CCCCCC;
-            }
-        """)
+        self.open_btn.setProperty("primary", True)
         button_layout.addWidget(self.open_btn)
         
         layout.addLayout(button_layout)
         self.setLayout(layout)
     
-    def on_item_selected(self, item):
+    def _load_projects_async(self, list_projects: Callable[[], List[dict]]):
+        """在线程池中加载项目列表，每批结果到达后追加到模型"""
+        self.title_label.setText("选择要打开的项目（正在加载...）")
+        runnable = _ProjectListRunnable(list_projects)
+        runnable.signals.page_ready.connect(self.project_model.append_projects)
+        runnable.signals.finished.connect(self._on_projects_loaded)
+        QThreadPool.globalInstance().start(runnable)
+    
+    def _on_projects_loaded(self):
+        """项目列表加载完成"""
+        self.title_label.setText("选择要打开的项目")
+    
+    def on_item_selected(self, current, previous=None):
         """项目选中事件"""
-        self.selected_project = item.data(Qt.UserRole)
-        self.open_btn.setEnabled(True)
-        self.delete_btn.setEnabled(True)
+        if not current.isValid():
+            self.selected_project = None
+            self.open_btn.setEnabled(False)
+            self.delete_btn.setEnabled(False)
+            return
+        self.selected_project = self.project_model.data(current, Qt.UserRole)
+        # 删除进行中时保持按钮禁用
+        self.open_btn.setEnabled(self._deleting_project is None)
+        self.delete_btn.setEnabled(self._deleting_project is None)
+        self._prefetch_project(self.selected_project['path'])
+    
+    def _prefetch_project(self, project_path: str):
+        """在后台预读选中项目的配置，已缓存或正在读取时跳过"""
+        if project_path in self._prefetched:
+            self._prefetched.move_to_end(project_path)
+            return
+        if project_path in self._prefetching:
+            return
+        self._prefetching.add(project_path)
+        runnable = _ProjectLoadRunnable(project_path)
+        runnable.signals.loaded.connect(self._on_project_prefetched)
+        QThreadPool.globalInstance().start(runnable)
+    
+    def _on_project_prefetched(self, project_path: str, mtime_ns: int, project_config: dict):
+        """项目配置预读完成"""
+        self._prefetching.discard(project_path)
+        self._prefetched[project_path] = (mtime_ns, project_config)
+        self._prefetched.move_to_end(project_path)
+        while len(self._prefetched) > _PREFETCH_CACHE_SIZE:
+            self._prefetched.popitem(last=False)
+    
+    def get_prefetched_config(self, project_path: str) -> Optional[Tuple[int, Dict]]:
+        """获取已预读的项目配置(mtime_ns, 配置)，尚未读取完成时返回None"""
+        return self._prefetched.get(project_path)
     
     def browse_project(self):
         """浏览项目文件夹"""
@@ -237,7 +425,7 @@ class OpenProjectDialog(QDialog):
     
     def delete_project(self):
         """删除项目"""
-        if not self.selected_project:
+        if not self.selected_project or self._deleting_project is not None:
             return
         
         reply = QMessageBox.question(
@@ -248,28 +436,63 @@ class OpenProjectDialog(QDialog):
         )
         
         if reply == QMessageBox.Yes:
-            # 发送删除信号给父窗口处理
-            try:
-                project_path = self.selected_project['path']
-                import shutil
-                shutil.rmtree(project_path)
-                
-                # 从列表中移除
-                current_row = self.project_list_widget.currentRow()
-                self.project_list_widget.takeItem(current_row)
-                
-                # 重置选择状态
-                self.selected_project = None
-                self.open_btn.setEnabled(False)
-                self.delete_btn.setEnabled(False)
-                
-                QMessageBox.information(self, "成功", "项目已删除！")
-                    
-            except Exception as e:
-                QMessageBox.critical(self, "错误", f"删除项目失败：{e}")
+            project_path = self.selected_project['path']
+            if not os.path.isdir(project_path):
+                QMessageBox.critical(self, "错误", f"删除项目失败：项目目录不存在\n{project_path}")
+                return
+            
+            # 删除期间禁用操作按钮，删除在线程池中进行
+            self._deleting_project = self.selected_project
+            self.open_btn.setEnabled(False)
+            self.delete_btn.setEnabled(False)
+            self.browse_btn.setEnabled(False)
+            self._delete_notification = show_loading(f"正在删除项目 '{self.selected_project['name']}'...")
+            
+            runnable = _RmTreeRunnable(project_path)
+            runnable.signals.finished.connect(self._on_delete_finished)
+            QThreadPool.globalInstance().start(runnable)
+    
+    def _on_delete_finished(self, ok: bool, error: str):
+        """项目目录删除完成"""
+        if self._delete_notification:
+            self._delete_notification.start_close_animation()
+            self._delete_notification = None
+        
+        project, self._deleting_project = self._deleting_project, None
+        project_path = project['path'] if project is not None else None
+        self.browse_btn.setEnabled(True)
+        if not ok:
+            logger.error(f"删除项目失败: {error}")
+            show_error(f"删除项目失败：{error}")
+            # 恢复按钮状态，允许重试
+            self.open_btn.setEnabled(self.selected_project is not None)
+            self.delete_btn.setEnabled(self.selected_project is not None)
+            return
+        
+        # 删除期间用户可能已选中其他项目，只有选中的仍是被删除项目时才重置选择
+        deleted_selected = (
+            self.selected_project is not None
+            and self.selected_project.get('path') == project_path
+        )
+        
+        # 按目录从列表中移除被删除的项目
+        if project_path is not None:
+            self.project_model.remove_project_path(project_path)
+        
+        if deleted_selected:
+            # 删除行后当前项会移到相邻行，需一并清除
+            self.project_list_widget.selectionModel().clear()
+            self.selected_project = None
+        self.open_btn.setEnabled(self.selected_project is not None)
+        self.delete_btn.setEnabled(self.selected_project is not None)
+        
+        show_success("项目已删除！")
     
     def accept(self):
         """确认打开"""
+        # 删除进行中时忽略打开（包括双击列表项）
+        if self._deleting_project is not None:
+            return
         if not self.selected_project:
             QMessageBox.warning(self, "警告", "请选择一个项目！")
             return
@@ -3,8 +3,25 @@ from PyQt5.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QMessageBox, QTextEdit
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from utils.logger import logger
+from core.project_manager import INVALID_NAME_RE
+
+try:
+    from .modern_styles import load_qss_file, register_app_stylesheet
+except ImportError:
+    from modern_styles import load_qss_file, register_app_stylesheet
+
+# 标题和提示文字样式
+_TITLE_QSS = "font-size: 16px; font-weight: bold; margin-bottom: 10px;"
+_TIP_QSS = "color: #666; font-size: 12px; margin-top: 10px;"
+
+# 输入校验的防抖间隔（毫秒）
+_VALIDATE_DELAY_MS = 120
+
+def _has_invalid_chars(name: str) -> bool:
+    """名称是否包含非法字符"""
+    return INVALID_NAME_RE.search(name) is not None
 
 class ProjectNameDialog(QDialog):
     """项目命名对话框"""
@@ -12,8 +29,12 @@ class ProjectNameDialog(QDialog):
     def __init__(self, parent=None, existing_projects=None):
         super().__init__(parent)
         self.existing_projects = existing_projects or []
+        # 用集合判断重名，避免每次校验线性扫描
+        self._existing_set = frozenset(self.existing_projects)
         self.project_name = ""
         self.project_description = ""
+        # 创建按钮样式在应用级样式表中，只解析一次
+        register_app_stylesheet(load_qss_file("components.qss"))
         self.init_ui()
         
     def init_ui(self):
@@ -26,7 +47,7 @@ class ProjectNameDialog(QDialog):
         
         # 标题
         title_label = QLabel("创建新项目")
-        title_label.setStyleSheet("font-size: 16px; font-weight: bold; margin-bottom: 10px;")
+        title_label.setStyleSheet(_TITLE_QSS)
         layout.addWidget(title_label)
         
         # 项目名称输入
@@ -35,7 +56,12 @@ class ProjectNameDialog(QDialog):
         
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText("请输入项目名称（必填）")
-        self.name_input.textChanged.connect(self.validate_input)
+        # 连续输入时合并校验，停止输入后再校验一次
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(_VALIDATE_DELAY_MS)
+        self._validate_timer.timeout.connect(self.validate_input)
+        self.name_input.textChanged.connect(lambda _text: self._validate_timer.start())
         layout.addWidget(self.name_input)
         
         # 项目描述输入
@@ -49,7 +75,7 @@ class ProjectNameDialog(QDialog):
         
         # 提示信息
         tip_label = QLabel("提示：项目名称将用作文件夹名称，请避免使用特殊字符")
-        tip_label.setStyleSheet("color: #666; font-size: 12px; margin-top: 10px;")
+        tip_label.setStyleSheet(_TIP_QSS)
         layout.addWidget(tip_label)
         
         # 按钮
@@ -64,23 +90,8 @@ class ProjectNameDialog(QDialog):
         self.create_btn = QPushButton("创建项目")
         self.create_btn.clicked.connect(self.create_project)
         self.create_btn.setEnabled(False)
-        self.create_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1976d2;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1565c0;
-            }
-            QPushButton:disabled {
-                background-color: #ccc;
-                color: #666;
-            }
-        """)
+        # 样式由应用级样式表中的 QPushButton#createBtn 提供
+        self.create_btn.setObjectName("createBtn")
         button_layout.addWidget(self.create_btn)
         
         layout.addLayout(button_layout)
@@ -98,13 +109,12 @@ class ProjectNameDialog(QDialog):
             return
         
         # 检查是否包含非法字符
-        invalid_chars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*']
-        if any(char in name for char in invalid_chars):
+        if _has_invalid_chars(name):
             self.create_btn.setEnabled(False)
             return
         
         # 检查是否已存在
-        if name in self.existing_projects:
+        if name in self._existing_set:
             self.create_btn.setEnabled(False)
             return
         
@@ -121,13 +131,12 @@ class ProjectNameDialog(QDialog):
             return
         
         # 检查非法字符
-        invalid_chars = ['<', '>', ':', '"', '/', '\\', '|', '?', '*']
-        if any(char in name for char in invalid_chars):
+        if _has_invalid_chars(name):
             QMessageBox.warning(self, "错误", "项目名称包含非法字符，请使用字母、数字、下划线或中文")
             return
         
         # 检查是否已存在
-        if name in self.existing_projects:
+        if name in self._existing_set:
             QMessageBox.warning(self, "错误", "项目名称已存在，请使用其他名称")
             return
         
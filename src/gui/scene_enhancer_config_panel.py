@@ -36,17 +36,93 @@ from utils.config_manager import ConfigManager
 from processors.scene_description_enhancer import SceneDescriptionEnhancer
 from utils.character_scene_manager import CharacterSceneManager
 
+# 界面中文选项 -> 配置值，以及反向映射（模块加载时构建一次）
+_STRATEGY_MAPPING = {
+    '自然': 'natural',
+    '结构化': 'structured',
+    '简约': 'minimal',
+    '智能': 'intelligent'
+}
+_LEVEL_MAPPING = {
+    '低': 'low',
+    '中': 'medium',
+    '高': 'high'
+}
+_PERFORMANCE_MAPPING = {
+    '快速': 'fast',
+    '平衡': 'balanced',
+    '质量': 'quality'
+}
+_STRATEGY_REVERSE_MAPPING = {v: k for k, v in _STRATEGY_MAPPING.items()}
+_LEVEL_REVERSE_MAPPING = {v: k for k, v in _LEVEL_MAPPING.items()}
+_PERFORMANCE_REVERSE_MAPPING = {v: k for k, v in _PERFORMANCE_MAPPING.items()}
+
+# 配置变更后延迟应用到增强器的时间（毫秒），拖动滑块等连续变更只应用一次
+_CONFIG_APPLY_DELAY_MS = 150
+
+# 可选：使用orjson加速配置和测试结果的序列化
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_pretty(data: Any) -> str:
+    """序列化为缩进2格、不转义中文的JSON文本，安装了orjson时优先使用"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _dumps_pretty_bytes(data: Any) -> bytes:
+    """同_dumps_pretty，直接返回UTF-8字节串用于写文件"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _load_config_section(data: bytes) -> Any:
+    """从导出的配置文件中取出config部分，文件中没有config时返回None"""
+    import_data = orjson.loads(data) if orjson is not None else json.loads(data)
+    return import_data.get('config') if isinstance(import_data, dict) else None
+
+
+def _format_test_result(test_description: str, details: Dict[str, Any]) -> str:
+    """将增强测试的详细结果格式化为显示文本"""
+    finished_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    return f"""测试完成时间: {finished_at}
+
+原始描述:
+{test_description}
+
+增强描述:
+{details['enhanced_description']}
+
+融合策略: {details['fusion_strategy']}
+质量评分: {details['fusion_quality_score']:.3f}
+
+技术细节:
+{_dumps_pretty(details.get('technical_details', {}))}
+
+一致性信息:
+{_dumps_pretty(details.get('consistency_info', {}))}
+
+{'='*50}
+"""
+
 
 class EnhancerTestWorker(QObject):
     """增强器测试工作线程"""
-    test_completed = pyqtSignal(dict)
+    test_completed = pyqtSignal(str)  # 格式化好的结果文本
     error_occurred = pyqtSignal(str)
     progress_updated = pyqtSignal(str)
     
-    def __init__(self, enhancer, test_description, characters=None):
+    def __init__(self, enhancer, test_description, characters=None, display_description=None):
         super().__init__()
         self.enhancer = enhancer
         self.test_description = test_description
+        # 结果中显示的原始描述（输入框中的原文，未去除首尾空白）
+        self.display_description = test_description if display_description is None else display_description
         self.characters = characters or []
     
     def run(self):
@@ -59,7 +135,8 @@ class EnhancerTestWorker(QObject):
                 self.characters
             )
             
-            self.test_completed.emit(details)
+            # 结果的JSON序列化和格式化在工作线程中完成，不占用界面线程
+            self.test_completed.emit(_format_test_result(self.display_description, details))
             
         except Exception as e:
             self.error_occurred.emit(str(e))
@@ -86,28 +163,13 @@ class SceneEnhancerConfigPanel(QDialog):
         # 测试结果存储
         self.test_results = []
         
-        # 中英文映射字典
-        self.strategy_mapping = {
-            '自然': 'natural',
-            '结构化': 'structured', 
-            '简约': 'minimal',
-            '智能': 'intelligent'
-        }
-        self.strategy_reverse_mapping = {v: k for k, v in self.strategy_mapping.items()}
-        
-        self.level_mapping = {
-            '低': 'low',
-            '中': 'medium',
-            '高': 'high'
-        }
-        self.level_reverse_mapping = {v: k for k, v in self.level_mapping.items()}
-        
-        self.performance_mapping = {
-            '快速': 'fast',
-            '平衡': 'balanced',
-            '质量': 'quality'
-        }
-        self.performance_reverse_mapping = {v: k for k, v in self.performance_mapping.items()}
+        # 中英文映射字典（共用模块级映射）
+        self.strategy_mapping = _STRATEGY_MAPPING
+        self.strategy_reverse_mapping = _STRATEGY_REVERSE_MAPPING
+        self.level_mapping = _LEVEL_MAPPING
+        self.level_reverse_mapping = _LEVEL_REVERSE_MAPPING
+        self.performance_mapping = _PERFORMANCE_MAPPING
+        self.performance_reverse_mapping = _PERFORMANCE_REVERSE_MAPPING
         
         # 配置数据
         self.current_config = {
@@ -120,6 +182,12 @@ class SceneEnhancerConfigPanel(QDialog):
             'performance_mode': 'balanced'
         }
         
+        # 配置变更合并定时器，需在创建控件前建立
+        self._apply_timer = QTimer(self)
+        self._apply_timer.setSingleShot(True)
+        self._apply_timer.setInterval(_CONFIG_APPLY_DELAY_MS)
+        self._apply_timer.timeout.connect(self._do_apply)
+        
         self.init_ui()
         self.load_config()
         self.init_enhancer()
@@ -478,11 +546,26 @@ class SceneEnhancerConfigPanel(QDialog):
                 logger.error(f"应用配置失败: {e}")
                 
     def on_config_changed(self):
-        """配置变更处理"""
+        """配置变更处理：合并短时间内的连续变更，停止变更后再应用"""
+        self._apply_timer.start()
+        
+    def _do_apply(self):
+        """应用配置变更并通知外部"""
         self.update_current_config()
         self.apply_config_to_enhancer()
         self.config_changed.emit(self.current_config)
         
+    def _flush_config_apply(self):
+        """立即应用尚未应用的配置变更"""
+        if self._apply_timer.isActive():
+            self._apply_timer.stop()
+            self._do_apply()
+        
+    def done(self, result):
+        """关闭对话框前应用尚未应用的配置变更"""
+        self._flush_config_apply()
+        super().done(result)
+        
     def on_quality_threshold_changed(self, value):
         """质量阈值变更处理"""
         threshold = value / 100.0
@@ -492,14 +575,9 @@ class SceneEnhancerConfigPanel(QDialog):
     def update_current_config(self):
         """更新当前配置"""
         # 将中文选项转换为英文配置值
-        strategy_cn = self.strategy_combo.currentText()
-        strategy_en = self.strategy_mapping.get(strategy_cn, 'intelligent')
-        
-        level_cn = self.enhancement_level_combo.currentText()
-        level_en = self.level_mapping.get(level_cn, 'medium')
-        
-        performance_cn = self.performance_mode_combo.currentText()
-        performance_en = self.performance_mapping.get(performance_cn, 'balanced')
+        strategy_en = _STRATEGY_MAPPING.get(self.strategy_combo.currentText(), 'intelligent')
+        level_en = _LEVEL_MAPPING.get(self.enhancement_level_combo.currentText(), 'medium')
+        performance_en = _PERFORMANCE_MAPPING.get(self.performance_mode_combo.currentText(), 'balanced')
         
         self.current_config.update({
             'fusion_strategy': strategy_en,
@@ -524,13 +602,13 @@ class SceneEnhancerConfigPanel(QDialog):
                 
             # 更新UI控件 - 将英文配置值转换为中文显示
             strategy_en = self.current_config.get('fusion_strategy', 'intelligent')
-            strategy_cn = self.strategy_reverse_mapping.get(strategy_en, '智能')
+            strategy_cn = _STRATEGY_REVERSE_MAPPING.get(strategy_en, '智能')
             self.strategy_combo.setCurrentText(strategy_cn)
             
             self.quality_threshold_slider.setValue(int(self.current_config.get('quality_threshold', 0.6) * 100))
             
             level_en = self.current_config.get('enhancement_level', 'medium')
-            level_cn = self.level_reverse_mapping.get(level_en, '中')
+            level_cn = _LEVEL_REVERSE_MAPPING.get(level_en, '中')
             self.enhancement_level_combo.setCurrentText(level_cn)
             
             self.technical_details_cb.setChecked(self.current_config.get('enable_technical_details', True))
@@ -538,7 +616,7 @@ class SceneEnhancerConfigPanel(QDialog):
             self.cache_enabled_cb.setChecked(self.current_config.get('cache_enabled', True))
             
             performance_en = self.current_config.get('performance_mode', 'balanced')
-            performance_cn = self.performance_reverse_mapping.get(performance_en, '平衡')
+            performance_cn = _PERFORMANCE_REVERSE_MAPPING.get(performance_en, '平衡')
             self.performance_mode_combo.setCurrentText(performance_cn)
             
             self.cache_size_spin.setValue(self.current_config.get('cache_size_limit', 100))
@@ -547,7 +625,7 @@ class SceneEnhancerConfigPanel(QDialog):
             # 加载自定义规则
             custom_rules = self.current_config.get('custom_rules', {})
             if custom_rules:
-                self.custom_rules_edit.setPlainText(json.dumps(custom_rules, indent=2, ensure_ascii=False))
+                self.custom_rules_edit.setPlainText(_dumps_pretty(custom_rules))
             
             # 应用配置到增强器
             self.apply_config_to_enhancer()
@@ -562,8 +640,7 @@ class SceneEnhancerConfigPanel(QDialog):
         """加载自定义规则到界面"""
         try:
             if custom_rules and hasattr(self, 'custom_rules_edit'):
-                import json
-                rules_text = json.dumps(custom_rules, indent=2, ensure_ascii=False)
+                rules_text = _dumps_pretty(custom_rules)
                 self.custom_rules_edit.setPlainText(rules_text)
         except Exception as e:
             logger.error(f"加载自定义规则失败: {e}")
@@ -609,8 +686,7 @@ class SceneEnhancerConfigPanel(QDialog):
                     'version': '1.0'
                 }
                 
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(export_data, f, indent=2, ensure_ascii=False)
+                Path(file_path).write_bytes(_dumps_pretty_bytes(export_data))
                     
                 QMessageBox.information(self, "成功", f"配置已导出到: {file_path}")
                 
@@ -626,11 +702,10 @@ class SceneEnhancerConfigPanel(QDialog):
             )
             
             if file_path:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    import_data = json.load(f)
+                config = _load_config_section(Path(file_path).read_bytes())
                     
-                if 'config' in import_data:
-                    self.current_config.update(import_data['config'])
+                if isinstance(config, dict):
+                    self.current_config.update(config)
                     self.load_config()  # 重新加载UI
                     QMessageBox.information(self, "成功", "配置导入成功")
                 else:
@@ -660,8 +735,12 @@ class SceneEnhancerConfigPanel(QDialog):
         if not self.enhancer:
             QMessageBox.warning(self, "错误", "增强器未初始化")
             return
+        
+        # 测试使用最新配置
+        self._flush_config_apply()
             
-        test_description = self.test_description_edit.toPlainText().strip()
+        raw_description = self.test_description_edit.toPlainText()
+        test_description = raw_description.strip()
         if not test_description:
             QMessageBox.warning(self, "错误", "请输入测试描述")
             return
@@ -676,7 +755,9 @@ class SceneEnhancerConfigPanel(QDialog):
         self.run_test_btn.setEnabled(False)
         
         # 创建工作线程
-        self.test_worker = EnhancerTestWorker(self.enhancer, test_description, characters)
+        self.test_worker = EnhancerTestWorker(
+            self.enhancer, test_description, characters, display_description=raw_description
+        )
         self.test_thread = QThread()
         self.test_worker.moveToThread(self.test_thread)
         
@@ -689,37 +770,13 @@ class SceneEnhancerConfigPanel(QDialog):
         # 启动线程
         self.test_thread.start()
         
-    def on_test_completed(self, details):
-        """测试完成处理"""
+    def on_test_completed(self, result_text):
+        """测试完成处理（结果文本已在工作线程中格式化）"""
         try:
-            # 格式化结果显示
-            result_text = f"""测试完成时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-原始描述:
-{self.test_description_edit.toPlainText()}
-
-增强描述:
-{details['enhanced_description']}
-
-融合策略: {details['fusion_strategy']}
-质量评分: {details['fusion_quality_score']:.3f}
-
-技术细节:
-{json.dumps(details.get('technical_details', {}), indent=2, ensure_ascii=False)}
-
-一致性信息:
-{json.dumps(details.get('consistency_info', {}), indent=2, ensure_ascii=False)}
-
-{'='*50}
-"""
-            
-            # 追加到结果显示区域
-            current_text = self.test_results_edit.toPlainText()
-            self.test_results_edit.setPlainText(current_text + result_text)
-            
-            # 滚动到底部
+            # 在末尾插入结果，不复制和重设已有内容，并滚动到底部
             cursor = self.test_results_edit.textCursor()
             cursor.movePosition(cursor.End)
+            cursor.insertText(result_text)
             self.test_results_edit.setTextCursor(cursor)
             
         except Exception as e:
@@ -38,6 +38,7 @@ class PollinationsClient:
                 - nologo: 是否去除水印 (默认: True)
                 - project_manager: 项目管理器实例 (可选, 从kwargs获取)
                 - current_project_name: 当前项目名称 (可选, 从kwargs获取)
+                - cancel_event: threading.Event，设置后中止下载 (可选, 从kwargs获取)
         
         Returns:
             生成的图片路径列表
@@ -48,6 +49,7 @@ class PollinationsClient:
 
         project_manager = kwargs.pop('project_manager', None)
         current_project_name = kwargs.pop('current_project_name', None)
+        cancel_event = kwargs.pop('cancel_event', None)
         logger.info(f"API相关参数 (kwargs after pop): {kwargs}") # ADDED Log
         
         # --- MODIFIED PARAMETER PREPARATION BLOCK START ---
@@ -107,17 +109,27 @@ class PollinationsClient:
             
             logger.info(f"API请求URL: {api_url}")
             
-            # 发送请求
-            response = self.session.get(api_url, timeout=60)
-            response.raise_for_status()
-            
-            # 保存图片
-            output_dir = self._get_output_dir(project_manager, current_project_name)
-            filename = f"pollinations_{int(time.time())}_{uuid.uuid4().hex[:8]}.png"
-            output_path = os.path.join(output_dir, filename)
+            # 发送请求（流式接收，下载过程中可响应取消）
+            with self.session.get(api_url, timeout=60, stream=True) as response:
+                response.raise_for_status()
+                
+                # 保存图片
+                output_dir = self._get_output_dir(project_manager, current_project_name)
+                filename = f"pollinations_{int(time.time())}_{uuid.uuid4().hex[:8]}.png"
+                output_path = os.path.join(output_dir, filename)
+                
+                cancelled = False
+                with open(output_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        if cancel_event is not None and cancel_event.is_set():
+                            cancelled = True
+                            break
+                        f.write(chunk)
             
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
+            if cancelled:
+                os.remove(output_path)
+                logger.info("Pollinations图片下载已取消")
+                return ["ERROR: 图像生成已取消"]
             
             logger.info(f"图片生成成功: {output_path}")
             return [output_path]
@@ -389,51 +389,69 @@ class TextProcessor:
         self.style_templates[name] = template
         logger.info(f"已添加风格模板: {name}")
     
+    def _storyboard_export_data(self, storyboard: StoryboardResult) -> Dict[str, Any]:
+        """分镜数据的JSON导出结构"""
+        return {
+            "shots": [
+                {
+                    "shot_id": shot.shot_id,
+                    "scene": shot.scene,
+                    "characters": shot.characters,
+                    "action": shot.action,
+                    "dialogue": shot.dialogue,
+                    "image_prompt": shot.image_prompt,
+                    "duration": shot.duration,
+                    "camera_angle": shot.camera_angle,
+                    "lighting": shot.lighting,
+                    "mood": shot.mood
+                }
+                for shot in storyboard.shots
+            ],
+            "total_duration": storyboard.total_duration,
+            "characters": storyboard.characters,
+            "scenes": storyboard.scenes,
+            "style": storyboard.style,
+            "metadata": storyboard.metadata
+        }
+    
+    def _iter_storyboard_markdown(self, storyboard: StoryboardResult):
+        """逐行生成分镜表Markdown（不含换行符）"""
+        yield "# 分镜表\n"
+        yield f"**风格**: {storyboard.style}"
+        yield f"**总时长**: {storyboard.total_duration:.1f}秒"
+        yield f"**角色**: {', '.join(storyboard.characters)}"
+        yield f"**场景**: {', '.join(storyboard.scenes)}\n"
+        
+        yield "| 镜头 | 场景 | 角色 | 动作 | 对话 | 画面描述 |"
+        yield "|------|------|------|------|------|----------|"
+        
+        for shot in storyboard.shots:
+            characters_str = ", ".join(shot.characters)
+            yield (
+                f"| {shot.shot_id} | {shot.scene} | {characters_str} | "
+                f"{shot.action} | {shot.dialogue} | {shot.image_prompt} |"
+            )
+    
     def export_storyboard(self, storyboard: StoryboardResult, format: str = "json") -> str:
         """导出分镜数据"""
         if format.lower() == "json":
-            data = {
-                "shots": [
-                    {
-                        "shot_id": shot.shot_id,
-                        "scene": shot.scene,
-                        "characters": shot.characters,
-                        "action": shot.action,
-                        "dialogue": shot.dialogue,
-                        "image_prompt": shot.image_prompt,
-                        "duration": shot.duration,
-                        "camera_angle": shot.camera_angle,
-                        "lighting": shot.lighting,
-                        "mood": shot.mood
-                    }
-                    for shot in storyboard.shots
-                ],
-                "total_duration": storyboard.total_duration,
-                "characters": storyboard.characters,
-                "scenes": storyboard.scenes,
-                "style": storyboard.style,
-                "metadata": storyboard.metadata
-            }
-            return json.dumps(data, ensure_ascii=False, indent=2)
+            return json.dumps(self._storyboard_export_data(storyboard), ensure_ascii=False, indent=2)
         
         elif format.lower() == "markdown":
-            lines = ["# 分镜表\n"]
-            lines.append(f"**风格**: {storyboard.style}")
-            lines.append(f"**总时长**: {storyboard.total_duration:.1f}秒")
-            lines.append(f"**角色**: {', '.join(storyboard.characters)}")
-            lines.append(f"**场景**: {', '.join(storyboard.scenes)}\n")
-            
-            lines.append("| 镜头 | 场景 | 角色 | 动作 | 对话 | 画面描述 |")
-            lines.append("|------|------|------|------|------|----------|")
-            
-            for shot in storyboard.shots:
-                characters_str = ", ".join(shot.characters)
-                lines.append(
-                    f"| {shot.shot_id} | {shot.scene} | {characters_str} | "
-                    f"{shot.action} | {shot.dialogue} | {shot.image_prompt} |"
-                )
-            
-            return "\n".join(lines)
+            return "\n".join(self._iter_storyboard_markdown(storyboard))
+        
+        else:
+            raise ValueError(f"不支持的导出格式: {format}")
+    
+    def write_storyboard(self, storyboard: StoryboardResult, fp, format: str = "json"):
+        """将分镜数据直接写入文件对象，不先生成完整的字符串"""
+        if format.lower() == "json":
+            json.dump(self._storyboard_export_data(storyboard), fp, ensure_ascii=False, indent=2)
+        
+        elif format.lower() == "markdown":
+            lines = self._iter_storyboard_markdown(storyboard)
+            fp.write(next(lines))
+            fp.writelines("\n" + line for line in lines)
         
         else:
             raise ValueError(f"不支持的导出格式: {format}")
\ No newline at end of file
@@ -7,6 +7,9 @@ from typing import Dict, List, Any, Optional
 from utils.logger import logger
 from utils.character_scene_manager import CharacterSceneManager
 
+# 计入完成度的步骤：文本改写、分镜生成、绘图、配音、视频合成
+_PROGRESS_STEPS = ('text_rewritten', 'shots_generated', 'images_generated', 'voices_generated', 'video_composed')
+
 class StoryboardProjectManager:
     """分镜项目管理器 - 负责分镜数据管理和图片处理"""
     
@@ -589,21 +592,8 @@ class StoryboardProjectManager:
     
     def _calculate_completion_percentage(self, progress_status: Dict[str, Any]) -> int:
         """计算项目完成百分比"""
-        total_steps = 5  # 文本改写、分镜生成、绘图、配音、视频合成
-        completed_steps = 0
-        
-        if progress_status.get('text_rewritten', False):
-            completed_steps += 1
-        if progress_status.get('shots_generated', False):
-            completed_steps += 1
-        if progress_status.get('images_generated', False):
-            completed_steps += 1
-        if progress_status.get('voices_generated', False):
-            completed_steps += 1
-        if progress_status.get('video_composed', False):
-            completed_steps += 1
-        
-        return int((completed_steps / total_steps) * 100)
+        completed_steps = sum(1 for step in _PROGRESS_STEPS if progress_status.get(step, False))
+        return completed_steps * 100 // len(_PROGRESS_STEPS)
     
     def _clean_project_data(self, project_data):
         """清理项目数据，移除空的或重复的条目"""